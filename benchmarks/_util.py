@@ -0,0 +1,16 @@
+# shared helpers for the benchmark scripts; importing this also puts the
+# repo root on sys.path so the scripts can import the pcd_* modules
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t)
+    return min(times)
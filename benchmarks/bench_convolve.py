@@ -0,0 +1,73 @@
+# Convolution engine benchmark: legacy scipy.ndimage.convolve with int64
+# kernels (as the edge / sharpening ops used to do it) vs pcd_ops.convolve
+# on OpenCV (sepFilter2D for rank-1 kernels, filter2D otherwise). Results
+# must be identical; the 8-direction Kirsch / Robinson ops are timed
+# against running all 8 kernels.
+#
+#   python benchmarks/bench_convolve.py [--size 3000x4000] [--repeat 3]
+import argparse
+
+import numpy as np
+from scipy import ndimage
+
+from _util import best_of  # also puts the repo root on sys.path
+import pcd_ops as ops
+
+PREWITT_X = np.array([[-1, 0, 1], [-1, 0, 1], [-1, 0, 1]])
+PREWITT_Y = np.array([[1, 1, 1], [0, 0, 0], [-1, -1, -1]])
+
+
+def legacy_prewitt(img):
+    return np.hypot(ndimage.convolve(img, PREWITT_X), ndimage.convolve(img, PREWITT_Y))
+
+
+def legacy_robert(img):
+    return np.hypot(ndimage.convolve(img, np.array([[1, 0], [0, -1]])),
+                    ndimage.convolve(img, np.array([[0, 1], [-1, 0]])))
+
+
+def legacy_highpass(img):
+    return ndimage.convolve(img, np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]]))
+
+
+def legacy_compass(img):
+    return np.maximum.reduce([np.abs(ndimage.convolve(img, k)) for k in ops.COMPASS_KERNELS])
+
+
+KIRSCH = ops.ring_kernels([5, 5, 5, -3, -3, -3, -3, -3])
+ROBINSON = ops.ring_kernels([1, 2, 1, 0, -1, -2, -1, 0])
+
+
+def eight_directions(kernels):
+    return lambda img: np.maximum.reduce([ndimage.correlate(img, k) for k in kernels])
+
+
+CASES = [
+    ("prewitt", legacy_prewitt, ops.MAGNITUDES["edge_prewitt"]),
+    ("robert", legacy_robert, ops.MAGNITUDES["edge_robert"]),
+    ("highpass", legacy_highpass, lambda img: ops.convolve(img, np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]]))),
+    ("compass", legacy_compass, ops.MAGNITUDES["edge_compass"]),
+    ("kirsch (8 dir)", eight_directions(KIRSCH), ops.MAGNITUDES["edge_kirsch"]),
+    ("robinson (8 dir)", eight_directions(ROBINSON), ops.MAGNITUDES["edge_robinson"]),
+]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", default="3000x4000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    rows, cols = map(int, args.size.lower().split("x"))
+    img = np.random.default_rng(0).integers(0, 256, (rows, cols)).astype(np.float32)
+    print(f"{args.size} gray float32")
+    print(f"{'kernel':>17} {'ndimage':>9} {'engine':>9} {'speedup':>8} {'same':>5}")
+    for label, legacy, fast in CASES:
+        t_legacy = best_of(lambda: legacy(img), args.repeat)
+        t_fast = best_of(lambda: fast(img), args.repeat)
+        same = np.array_equal(legacy(img), fast(img))
+        print(f"{label:>17} {t_legacy:8.3f}s {t_fast:8.3f}s {t_legacy / t_fast:7.1f}x {str(same):>5}")
+
+
+if __name__ == "__main__":
+    main()
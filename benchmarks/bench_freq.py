@@ -0,0 +1,57 @@
+# Frequency filter benchmark: legacy complex fft2/fftshift path (as the UI
+# used to do it) vs the pcd_freq rfft2 + next_fast_len engine.
+#
+#   python benchmarks/bench_freq.py [--sizes 1009x1013,2039x3001,4000x6000] [--repeat 3]
+import argparse
+
+import numpy as np
+from scipy.fft import fft2, ifft2, fftshift, ifftshift
+
+from _util import best_of  # also puts the repo root on sys.path
+import pcd_freq as freq
+
+
+def legacy_blpf(img, d0, n=2):
+    rows, cols = img.shape
+    fshift = fftshift(fft2(img.astype(np.float32)))
+    crow, ccol = rows//2, cols//2
+    Y, X = np.ogrid[:rows, :cols]
+    D = np.sqrt((X - ccol)**2 + (Y - crow)**2)
+    H = 1 / (1 + (D / (d0+1e-6))**(2*n))
+    img_back = np.real(ifft2(ifftshift(fshift * H)))
+    return np.clip(img_back, 0, 255).astype(np.uint8)
+
+
+def engine_blpf(img, d0, n=2, pad=True, spectrum=None):
+    spectrum = spectrum or freq.Spectrum(img, pad=pad)
+    return spectrum.apply(freq.blpf(spectrum.shape, d0, n, fshape=spectrum.fshape))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="1009x1013,2039x3001,4000x6000")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--d0", type=float, default=40)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    print(f"{'size':>11} {'fast size':>11} {'legacy':>9} {'rfft':>9} {'rfft+pad':>9} "
+          f"{'tick':>9} {'speedup':>8} {'maxdiff':>8}")
+    for spec in args.sizes.split(","):
+        rows, cols = map(int, spec.lower().split("x"))
+        img = rng.integers(0, 256, (rows, cols), dtype=np.uint8)
+        freq.CACHE.clear()
+        t_legacy = best_of(lambda: legacy_blpf(img, args.d0), args.repeat)
+        t_rfft = best_of(lambda: engine_blpf(img, args.d0, pad=False), args.repeat)
+        t_pad = best_of(lambda: engine_blpf(img, args.d0, pad=True), args.repeat)
+        # slider tick: spectrum and transfer function already cached
+        spectrum = freq.Spectrum(img)
+        t_tick = best_of(lambda: engine_blpf(img, args.d0, spectrum=spectrum), args.repeat)
+        # unpadded engine vs legacy; only float32 H rounding is expected (<= 1 level)
+        diff = np.abs(legacy_blpf(img, args.d0).astype(int) - engine_blpf(img, args.d0, pad=False)).max()
+        print(f"{spec:>11} {'x'.join(map(str, freq.fast_shape((rows, cols)))):>11} "
+              f"{t_legacy:8.3f}s {t_rfft:8.3f}s {t_pad:8.3f}s {t_tick:8.3f}s {t_legacy / t_pad:7.1f}x {diff:8d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+# Custom kernel benchmark: scipy.ndimage.convolve (direct, O(taps) per
+# pixel) vs pcd_ops.convolve with each method and the one "auto" picks from
+# its measured cost model. Prints the max difference to ndimage.
+#
+#   python benchmarks/bench_kernel.py [--size 1000x1000] [--kernels 7,31,61] [--repeat 2]
+import argparse
+
+import numpy as np
+from scipy import ndimage
+
+from _util import best_of  # also puts the repo root on sys.path
+import pcd_ops as ops
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", default="1000x1000")
+    parser.add_argument("--kernels", default="7,31,61")
+    parser.add_argument("--repeat", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    rows, cols = map(int, args.size.lower().split("x"))
+    rng = np.random.default_rng(0)
+    img = rng.integers(0, 256, (rows, cols)).astype(np.float32)
+    print(f"{args.size} gray float32")
+    print(f"{'kernel':>8} {'ndimage':>9} {'spatial':>9} {'fft':>9} {'oa':>9} {'auto':>6} {'speedup':>8} {'max diff':>9}")
+    for n in map(int, args.kernels.split(",")):
+        kernel = rng.random((n, n)) / (n * n)  # not separable
+        t_legacy = best_of(lambda: ndimage.convolve(img, kernel), 1)
+        ref = ndimage.convolve(img, kernel)
+        times = {m: best_of(lambda: ops.convolve(img, kernel, m), args.repeat) for m in ("spatial", "fft", "oa")}
+        auto = ops.conv_method(kernel.shape)
+        diff = max(float(np.abs(ops.convolve(img, kernel, m) - ref).max()) for m in times)
+        print(f"{f'{n}x{n}':>8} {t_legacy:8.3f}s " + " ".join(f"{times[m]:8.3f}s" for m in times) +
+              f" {auto:>6} {t_legacy / times[auto]:7.0f}x {diff:9.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# Point-op fusion benchmark: a tonal pipeline run op by op (one full image
+# pass each) vs pcd_ops.run_pipeline, which fuses it into one LUT pass.
+#
+#   python benchmarks/bench_lut.py [--size 3000x4000] [--repeat 3]
+import argparse
+
+import numpy as np
+
+from _util import best_of  # also puts the repo root on sys.path
+import pcd_ops as ops
+
+PIPELINES = {
+    "1 op": [("arithmetic_add", {"value": 20})],
+    "5 ops": [("arithmetic_add", {"value": 20}), ("arithmetic_multiply", {"factor": 1.2}),
+              ("enhance_brightness", {"factor": 0.9}), ("negative", {"strength": 30}),
+              ("arithmetic_subtract", {"value": 10})],
+    "5 ops + contrast": [("arithmetic_add", {"value": 20}), ("enhance_contrast", {"factor": 1.4}),
+                         ("enhance_brightness", {"factor": 0.9}), ("negative", {"strength": 30}),
+                         ("arithmetic_subtract", {"value": 10})],
+    "to binary": [("arithmetic_multiply", {"factor": 1.3}), ("enhance_brightness", {"factor": 1.1}),
+                  ("thresholding", {"threshold": 140}), ("boolean_not", {})],
+}
+
+
+def step_by_step(img, steps):
+    for name, params in steps:
+        img = ops.apply(name, img, **params)
+    return img
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", default="3000x4000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    rows, cols = map(int, args.size.lower().split("x"))
+    img = np.random.default_rng(0).integers(0, 256, (rows, cols, 3), dtype=np.uint8)
+    print(f"{args.size} RGB")
+    print(f"{'pipeline':>17} {'op by op':>9} {'fused':>9} {'speedup':>8} {'same':>5}")
+    for label, steps in PIPELINES.items():
+        t_steps = best_of(lambda: step_by_step(img, steps), args.repeat)
+        t_fused = best_of(lambda: ops.run_pipeline(img, steps), args.repeat)
+        same = np.array_equal(step_by_step(img, steps), ops.run_pipeline(img, steps))
+        print(f"{label:>17} {t_steps:8.4f}s {t_fused:8.4f}s {t_steps / t_fused:7.1f}x {str(same):>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Strip-parallel scaling benchmark: each op on one core (plain pcd_ops call)
+# vs pcd_tiles.run_parallel with 1..N worker threads. Results must be
+# identical to the single-call output (no seams at strip borders).
+#
+#   python benchmarks/bench_parallel.py [--size 3000x4000] [--workers 1,2,4,8] [--repeat 3]
+import argparse
+import os
+
+import cv2
+import numpy as np
+
+from _util import best_of  # also puts the repo root on sys.path
+import pcd_ops as ops
+import pcd_tiles as tiles
+
+CASES = [
+    ("smoothing_median", {"k": 15}),
+    ("edge_compass", {}),
+    ("edge_prewitt", {}),
+    ("edge_robert", {}),
+    ("convolution", {}),
+    ("sharpening_highboost", {"A": 2.0}),
+]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", default="3000x4000")
+    parser.add_argument("--workers", default=None, help="comma list (default: 1,2,4,... up to the core count)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    cores = os.cpu_count() or 1
+    counts = [int(n) for n in args.workers.split(",")] if args.workers else \
+        sorted({1, cores} | {2**i for i in range(1, 8) if 2**i < cores})
+    rows, cols = map(int, args.size.lower().split("x"))
+    rng = np.random.default_rng(0)
+    img = cv2.GaussianBlur(rng.integers(0, 256, (rows, cols, 3), dtype=np.uint8), (0, 0), 2)
+
+    print(f"{args.size} RGB, {cores} core(s), OpenCV threads: {cv2.getNumThreads()}")
+    print(f"{'op':>22} {'1 call':>9} " + " ".join(f"{f'{n} thr':>14}" for n in counts) + f" {'same':>5}")
+    for name, params in CASES:
+        single = ops.apply(name, img, **params)
+        t_single = best_of(lambda: ops.apply(name, img, **params), args.repeat)
+        cells, same = [], True
+        for n in counts:
+            same &= np.array_equal(tiles.run_parallel(img, name, params, workers=n), single)
+            t = best_of(lambda: tiles.run_parallel(img, name, params, workers=n), args.repeat)
+            cells.append(f"{t:7.3f}s {t_single / t:4.1f}x")
+        print(f"{name:>22} {t_single:8.3f}s " + " ".join(f"{c:>14}" for c in cells) + f" {str(same):>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# Pointwise ops benchmark: legacy float32 upcast/clip/cast path (as the UI
+# used to do it) vs pcd_ops' uint8 lookup tables. Reports time, peak extra
+# memory allocated during the call and whether the outputs are identical.
+#
+#   python benchmarks/bench_pointwise.py [--size 3000x4000] [--repeat 5]
+import argparse
+import tracemalloc
+
+import numpy as np
+
+from _util import best_of  # also puts the repo root on sys.path
+import pcd_ops as ops
+
+
+def legacy_negative(img, strength=100):
+    strength = strength / 100.0
+    img_array = np.asarray(img, dtype=np.float32)
+    inverted = 255 - img_array
+    result = img_array + strength * (inverted - img_array)
+    return np.clip(result, 0, 255).astype(np.uint8)
+
+
+def legacy_add(img, value=50):
+    return np.clip(np.asarray(img, dtype=np.float32) + value, 0, 255).astype(np.uint8)
+
+
+def legacy_subtract(img, value=50):
+    return np.clip(np.asarray(img, dtype=np.float32) - value, 0, 255).astype(np.uint8)
+
+
+def legacy_multiply(img, factor=1.0):
+    return np.clip(np.asarray(img, dtype=np.float32) * factor, 0, 255).astype(np.uint8)
+
+
+def legacy_divide(img, factor=1.0):
+    if factor == 0: factor = 1e-3
+    return np.clip(np.asarray(img, dtype=np.float32) / factor, 0, 255).astype(np.uint8)
+
+
+CASES = [
+    ("negative", legacy_negative, ops.negative, {"strength": 60}),
+    ("arithmetic_add", legacy_add, ops.arithmetic_add, {"value": 40}),
+    ("arithmetic_subtract", legacy_subtract, ops.arithmetic_subtract, {"value": 40}),
+    ("arithmetic_multiply", legacy_multiply, ops.arithmetic_multiply, {"factor": 1.7}),
+    ("arithmetic_divide", legacy_divide, ops.arithmetic_divide, {"factor": 0.6}),
+]
+
+
+def peak_alloc(fn):
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", default="3000x4000")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rows, cols = map(int, args.size.lower().split("x"))
+    img = np.random.default_rng(0).integers(0, 256, (rows, cols, 3), dtype=np.uint8)
+    print(f"{args.size} RGB ({img.nbytes / 1e6:.0f} MB)")
+    print(f"{'op':>20} {'legacy':>9} {'lut':>9} {'speedup':>8} {'legacy MB':>10} {'lut MB':>7} {'same':>5}")
+    for name, legacy, fast, params in CASES:
+        t_legacy = best_of(lambda: legacy(img, **params), args.repeat)
+        t_fast = best_of(lambda: fast(img, **params), args.repeat)
+        same = np.array_equal(legacy(img, **params), fast(img, **params))
+        print(f"{name:>20} {t_legacy:8.4f}s {t_fast:8.4f}s {t_legacy / t_fast:7.1f}x "
+              f"{peak_alloc(lambda: legacy(img, **params)):10.0f} {peak_alloc(lambda: fast(img, **params)):7.0f} "
+              f"{str(same):>5}")
+
+
+if __name__ == "__main__":
+    main()
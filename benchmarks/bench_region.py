@@ -0,0 +1,83 @@
+# Region growing benchmark: legacy per-pixel Python stack loop (as the UI
+# used to do it) vs pcd_ops' scan-line flood fill. Masks must be identical;
+# 8-connectivity and multiple seeds are checked against scipy.ndimage.label.
+#
+#   python benchmarks/bench_region.py [--sizes 300x400,600x800] [--tol 20] [--repeat 3]
+import argparse
+
+import cv2
+import numpy as np
+from scipy import ndimage
+
+from _util import best_of  # also puts the repo root on sys.path
+import pcd_ops as ops
+
+
+def legacy_region_growing(img, x, y, tol=10):
+    h, w = img.shape
+    visited = np.zeros_like(img, dtype=bool)
+    seed_val = int(img[y, x])
+    stack = [(y,x)]
+    mask = np.zeros_like(img, dtype=np.uint8)
+    while stack:
+        cy, cx = stack.pop()
+        if cy<0 or cx<0 or cy>=h or cx>=w or visited[cy,cx]:
+            continue
+        visited[cy,cx] = True
+        if abs(int(img[cy,cx]) - seed_val) <= tol:
+            mask[cy,cx] = 255
+            neighbors = [(cy+1,cx),(cy-1,cx),(cy,cx+1),(cy,cx-1)]
+            stack.extend(neighbors)
+    return mask
+
+
+def label_region(img, seeds, tol, connectivity):
+    structure = ndimage.generate_binary_structure(2, 1 if connectivity == 4 else 2)
+    region = np.zeros(img.shape, dtype=bool)
+    for x, y in seeds:
+        labels, _ = ndimage.label(np.abs(img.astype(int) - int(img[y, x])) <= tol, structure)
+        region |= labels == labels[y, x]
+    return region.astype(np.uint8) * 255
+
+
+def test_images(rows, cols, rng):
+    # "flat": one huge uniform-ish region (worst case for the loop),
+    # "blobs": blurred noise, many medium regions with ragged borders
+    yy, xx = np.mgrid[:rows, :cols]
+    flat = (100 + 4 * np.sin(xx / 50) + rng.integers(0, 3, (rows, cols))).astype(np.uint8)
+    flat[rows//3:rows//3 + 5, :] = 200
+    blobs = cv2.GaussianBlur(rng.integers(0, 256, (rows, cols), dtype=np.uint8), (0, 0), 4)
+    blobs = cv2.normalize(blobs, None, 0, 255, cv2.NORM_MINMAX)
+    return {"flat": flat, "blobs": blobs}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="300x400,600x800")
+    parser.add_argument("--tol", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    print(f"{'size':>9} {'image':>6} {'region':>8} {'legacy':>9} {'fast':>9} {'speedup':>8} "
+          f"{'same':>5} {'8-conn':>7} {'seeds':>6}")
+    for spec in args.sizes.split(","):
+        rows, cols = map(int, spec.lower().split("x"))
+        for kind, img in test_images(rows, cols, rng).items():
+            x, y = cols // 2, rows // 2
+            legacy = legacy_region_growing(img, x, y, args.tol)
+            fast = ops.segmentation_region_growing(img, x, y, args.tol)
+            t_legacy = best_of(lambda: legacy_region_growing(img, x, y, args.tol), 1)
+            t_fast = best_of(lambda: ops.segmentation_region_growing(img, x, y, args.tol), args.repeat)
+            same8 = np.array_equal(ops.segmentation_region_growing(img, x, y, args.tol, connectivity=8),
+                                   label_region(img, [(x, y)], args.tol, 8))
+            seeds = [tuple(p) for p in rng.integers(0, (cols, rows), (4, 2))]
+            same_seeds = np.array_equal(ops.segmentation_region_growing(img, x, y, args.tol, seeds=seeds),
+                                        label_region(img, [(x, y)] + seeds, args.tol, 4))
+            print(f"{spec:>9} {kind:>6} {np.count_nonzero(fast):8d} {t_legacy:8.3f}s {t_fast:8.4f}s "
+                  f"{t_legacy / t_fast:7.0f}x {str(np.array_equal(legacy, fast)):>5} "
+                  f"{str(same8):>7} {str(same_seeds):>6}")
+
+
+if __name__ == "__main__":
+    main()
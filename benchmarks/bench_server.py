@@ -0,0 +1,105 @@
+# HTTP service throughput: N concurrent clients posting the same operation,
+# with micro-batching off (--max-batch 1) and on, for several pool sizes.
+# Batching must never be slower than sending every request on its own.
+# --simulate MS replaces the op by one that holds its worker for MS ms, a
+# stand-in for one core per worker on machines with fewer cores (use a
+# tiny --size then, so decoding doesn't take the real cores).
+#
+#   python benchmarks/bench_server.py [--op color_grayscale] [--size 480x640] [--workers 1,4,8]
+#       [--requests 160]
+#   python benchmarks/bench_server.py --simulate 50 --size 32x32 --workers 4,8
+import argparse
+import asyncio
+import http.client
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+import _util  # noqa: F401  (puts the repo root on sys.path)
+import pcd_ops as ops
+import pcd_server
+
+
+def hold(img, ms=50):
+    time.sleep(ms / 1000)
+    return img
+
+
+def start(workers, batch_ms, max_batch):
+    # server on its own event loop thread, workers forked after the op table
+    # is final so a simulated op exists in them too
+    loop = asyncio.new_event_loop()
+    srv = pcd_server.Server(workers=workers, batch_ms=batch_ms, max_batch=max_batch)
+    ready = threading.Event()
+
+    def serve():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(srv.start("127.0.0.1", 0))
+        ready.set()
+        loop.run_forever()
+
+    threading.Thread(target=serve, daemon=True).start()
+    ready.wait()
+    return srv, lambda: asyncio.run_coroutine_threadsafe(srv.close(), loop).result()
+
+
+def measure(workers, clients, batch_ms, max_batch, path, body, n):
+    srv, stop = start(workers, batch_ms, max_batch)
+
+    def one(_):
+        conn = http.client.HTTPConnection("127.0.0.1", srv.port)
+        conn.request("POST", path, body=body)
+        resp = conn.getresponse()
+        resp.read()
+        conn.close()
+        return resp.status
+
+    try:
+        with ThreadPoolExecutor(clients) as pool:
+            list(pool.map(one, range(2 * workers)))  # warm up the workers
+            t = time.perf_counter()
+            statuses = set(pool.map(one, range(n)))
+            wall = time.perf_counter() - t
+        metrics = srv.metrics.snapshot()
+    finally:
+        stop()
+    name = path.split("/")[-1].split("?")[0]
+    return n / wall, metrics["mean_batch_size"], metrics["ops"][name]["latency_ms"]["p50"], statuses
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--op", default="color_grayscale")
+    parser.add_argument("--size", default="480x640")
+    parser.add_argument("--workers", default="1,4,8")
+    parser.add_argument("--requests", type=int, default=160)
+    parser.add_argument("--simulate", type=float, default=None, metavar="MS")
+    args = parser.parse_args(argv)
+
+    op = args.op
+    if args.simulate is not None:
+        op = "hold"
+        ops.OPERATIONS[op] = hold
+    path = f"/ops/{op}" + (f"?ms={args.simulate}" if args.simulate is not None else "")
+    rows, cols = map(int, args.size.lower().split("x"))
+    buf = io.BytesIO()
+    Image.fromarray(np.random.default_rng(0).integers(0, 256, (rows, cols, 3), dtype=np.uint8)).save(buf, "JPEG")
+    body = buf.getvalue()
+
+    print(f"{op} on {args.size} JPEG, {args.requests} requests")
+    print(f"{'workers':>7} {'clients':>7} {'batching':>9} {'req/s':>7} {'batch':>6} {'p50 ms':>7}")
+    for workers in map(int, args.workers.split(",")):
+        for clients in (workers, 2 * workers):
+            for label, batch_ms, max_batch in (("off", 0, 1), ("5ms/8", 5, 8)):
+                rate, batch, p50, statuses = measure(workers, clients, batch_ms, max_batch, path, body,
+                                                     args.requests)
+                assert statuses == {200}, statuses
+                print(f"{workers:>7} {clients:>7} {label:>9} {rate:7.1f} {batch:6.2f} {p50:7.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# Large-kernel smoothing benchmark: the legacy median (RGB->BGR->RGB
+# cvtColor round trip around cv2.medianBlur) vs pcd_ops.smoothing_median,
+# and smoothing_lowpass, over growing kernel sizes. Both ops should take
+# about the same time whatever k is.
+#
+#   python benchmarks/bench_smoothing.py [--size 3000x4000] [--kernels 3,7,31,101,301] [--repeat 2]
+import argparse
+
+import cv2
+import numpy as np
+
+from _util import best_of  # also puts the repo root on sys.path
+import pcd_ops as ops
+
+
+def legacy_median(img, k):
+    img = cv2.cvtColor(img, cv2.COLOR_RGB2BGR)
+    return cv2.cvtColor(cv2.medianBlur(img, k), cv2.COLOR_BGR2RGB)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", default="3000x4000")
+    parser.add_argument("--kernels", default="3,7,31,101,301")
+    parser.add_argument("--repeat", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    rows, cols = map(int, args.size.lower().split("x"))
+    img = cv2.GaussianBlur(np.random.default_rng(0).integers(0, 256, (rows, cols, 3), dtype=np.uint8), (0, 0), 2)
+    print(f"{args.size} RGB")
+    print(f"{'k':>5} {'legacy median':>14} {'median':>9} {'same':>5} {'lowpass':>9}")
+    for k in map(int, args.kernels.split(",")):
+        t_legacy = best_of(lambda: legacy_median(img, k), args.repeat)
+        t_median = best_of(lambda: ops.smoothing_median(img, k), args.repeat)
+        same = np.array_equal(legacy_median(img, k), ops.smoothing_median(img, k))
+        t_box = best_of(lambda: ops.smoothing_lowpass(img, k), args.repeat)
+        print(f"{k:>5} {t_legacy:13.3f}s {t_median:8.3f}s {str(same):>5} {t_box:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
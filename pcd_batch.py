@@ -0,0 +1,144 @@
+# =========================
+# JPEGirls batch mode
+# =========================
+# Applies an ordered operation pipeline to every image in a directory / glob
+# using a process pool, e.g.
+#
+#   python pcd_batch.py photos/ -o out/ -p grayscale -p histogram_equalization \
+#       -p "edge_canny:low=50,high=150"
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from PIL import Image
+
+import pcd_ops as ops
+
+IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".tif")
+
+
+def collect_inputs(patterns):
+    files = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for name in sorted(os.listdir(pattern)):
+                if name.lower().endswith(IMAGE_EXTS):
+                    files.append(os.path.join(pattern, name))
+        else:
+            files.extend(sorted(glob.glob(pattern, recursive=True)))
+    # keep order, drop duplicates from overlapping patterns
+    return list(dict.fromkeys(files))
+
+
+def output_paths(files, out_dir, ext=None):
+    # mirror the inputs' folders below their common parent, so photos/a.jpg
+    # and scans/a.jpg don't overwrite each other; names that still collide
+    # (a.jpg and a.png with --ext) are an error rather than a silent overwrite
+    if not files:
+        return []
+    root = os.path.commonpath([os.path.dirname(os.path.abspath(f)) for f in files])
+    paths, seen = [], {}
+    for src in files:
+        stem, src_ext = os.path.splitext(os.path.relpath(os.path.abspath(src), root))
+        dst = os.path.join(out_dir, stem + (ext or src_ext))
+        other = seen.setdefault(os.path.normcase(dst), src)
+        if other != src:
+            raise ValueError(f"{other} and {src} would both be written to {dst}")
+        paths.append(dst)
+    return paths
+
+
+def process_file(src, dst, steps):
+    # runs in a worker process; never raises so one bad file can't kill the batch
+    start = time.perf_counter()
+    try:
+        img = np.array(Image.open(src).convert("RGB"))
+        megapixels = img.shape[0] * img.shape[1] / 1e6
+        result = ops.run_pipeline(img, steps)
+        Image.fromarray(result).save(dst)
+        return src, time.perf_counter() - start, megapixels, None
+    except Exception as e:
+        return src, time.perf_counter() - start, 0.0, f"{type(e).__name__}: {e}"
+
+
+def run_batch(files, out_dir, steps, jobs=None, ext=None, log=print):
+    dsts = output_paths(files, out_dir, ext)
+    for folder in sorted({os.path.dirname(dst) for dst in dsts} | {out_dir}):
+        os.makedirs(folder, exist_ok=True)
+    jobs = jobs or os.cpu_count() or 1
+    ok, failed, busy, megapixels = 0, 0, 0.0, 0.0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(process_file, f, dst, steps) for f, dst in zip(files, dsts)]
+        for fut in as_completed(futures):
+            src, seconds, mp, error = fut.result()
+            busy += seconds
+            if error:
+                failed += 1
+                log(f"FAIL {src} ({seconds*1000:.1f} ms): {error}")
+            else:
+                ok += 1
+                megapixels += mp
+                log(f"ok   {src} ({seconds*1000:.1f} ms, {mp:.2f} MP)")
+    wall = time.perf_counter() - start
+    summary = {
+        "files": len(files), "ok": ok, "failed": failed, "jobs": jobs,
+        "wall_s": wall, "cpu_busy_s": busy,
+        "images_per_s": ok / wall if wall > 0 else 0.0,
+        "megapixels_per_s": megapixels / wall if wall > 0 else 0.0,
+        "mean_ms_per_image": busy / max(1, ok + failed) * 1000,
+    }
+    log(f"\n{ok}/{len(files)} images in {wall:.2f} s with {jobs} workers "
+        f"-> {summary['images_per_s']:.2f} img/s, {summary['megapixels_per_s']:.2f} MP/s, "
+        f"{summary['mean_ms_per_image']:.1f} ms/image avg"
+        + (f", {failed} failed" if failed else ""))
+    return summary
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Apply a JPEGirls operation pipeline to many images.")
+    parser.add_argument("inputs", nargs="*", help="input directories and/or glob patterns")
+    parser.add_argument("-o", "--output", help="output directory")
+    parser.add_argument("-p", "--op", dest="ops", action="append", default=[], metavar="NAME[:k=v,...]",
+                        help="operation step, repeat in order (e.g. -p grayscale -p edge_canny:low=50,high=150)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--ext", default=None, help="output extension, e.g. .png (default: same as input)")
+    parser.add_argument("--list-ops", action="store_true", help="print available operations and exit")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.list_ops:
+        print("\n".join(ops.OPERATIONS))
+        return 0
+    if not args.inputs or not args.output:
+        parser.error("inputs and -o/--output are required")
+    try:
+        steps = [ops.parse_step(spec) for spec in args.ops]
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    if not steps:
+        print("error: no operations given (use -p NAME)", file=sys.stderr)
+        return 2
+    files = collect_inputs(args.inputs)
+    if not files:
+        print("error: no input images found", file=sys.stderr)
+        return 2
+    ext = args.ext if not args.ext or args.ext.startswith(".") else "." + args.ext
+    try:
+        summary = run_batch(files, args.output, steps, jobs=args.jobs, ext=ext)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+# =========================
+# Frequency-domain helpers (headless)
+# =========================
+# Spectrum keeps the FFT of an image so that filters with different cutoffs
+# can be applied without redoing the forward FFT (slider previews only pay
+# for mask multiply + inverse FFT per tick).
+#
+# Input is real, so we use rfft2/irfft2 (half the work and memory of the
+# complex fft2) and pad each axis to a scipy next_fast_len size: prime-sized
+# photos otherwise fall onto the slow Bluestein path. The pad is mirrored
+# (no wrap-around bleeding at the borders) and cropped off again.
+# Padding changes the frequency grid the transfer function is sampled on,
+# so results are not identical to the unpadded ones: smooth filters
+# (Gaussian, Butterworth) differ only near the borders, but the ideal
+# filters' hard cutoff now falls on different bins and ILPF/IHPF output
+# moves by a few levels across a large share of the image too.
+# Transfer functions are built directly in the unshifted rfft layout,
+# radius still measured in the original image's frequency units.
+#
+# RGB images keep their colour: the channels go through one batched,
+# multi-threaded FFT and share the same (broadcast) transfer function.
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from scipy.fft import rfft2, irfft2, next_fast_len
+
+# default worker threads for scipy.fft (-1 = all cores)
+WORKERS = -1
+
+
+def fast_shape(shape):
+    return tuple(next_fast_len(int(n), real=True) for n in shape)
+
+
+class Spectrum:
+    def __init__(self, img, pad=True, workers=None):
+        img = np.asarray(img)
+        self.shape = img.shape[:2]
+        self.channels = img.shape[2] if img.ndim == 3 else 0
+        self.fshape = fast_shape(self.shape) if pad else self.shape
+        self.workers = WORKERS if workers is None else workers
+        pad_width = [(0, f - n) for f, n in zip(self.fshape, self.shape)]
+        if self.channels:
+            # channels first, so the batch is contiguous planes transformed
+            # over the last two axes in a single call
+            img = np.moveaxis(img, 2, 0)
+            pad_width = [(0, 0)] + pad_width
+        # moveaxis alone is a strided view; astype would keep that layout
+        img = np.ascontiguousarray(img, dtype=np.float32)
+        if self.fshape != self.shape:
+            img = np.pad(img, pad_width, mode="symmetric")
+        self.F = rfft2(img, workers=self.workers)
+
+    def apply(self, H):
+        rows, cols = self.shape
+        img_back = irfft2(self.F * H, s=self.fshape, workers=self.workers)[..., :rows, :cols]
+        if self.channels:
+            img_back = np.moveaxis(img_back, 0, 2)
+        return np.clip(img_back, 0, 255).astype(np.uint8)
+
+
+def magnitude_spectrum(img, workers=None):
+    # full, centered |F| for display, rebuilt from the rfft half via
+    # Hermitian symmetry |F(-u,-v)| = |F(u,v)| (no padding: the picture
+    # has to show the spectrum of the image as it is)
+    img = np.asarray(img, dtype=np.float32)
+    rows, cols = img.shape
+    half = np.abs(rfft2(img, workers=WORKERS if workers is None else workers))
+    full = np.empty((rows, cols), dtype=half.dtype)
+    full[:, :half.shape[1]] = half
+    if cols > half.shape[1]:
+        j = np.arange(half.shape[1], cols)
+        i = (-np.arange(rows)) % rows
+        full[:, j] = half[i[:, None], cols - j]
+    return np.roll(full, (rows//2, cols//2), axis=(0, 1))
+
+
+# ========== Cache ==========
+# Distance grids (per shape) and transfer functions (per shape, kind, d0, n)
+# are reused across calls; same-sized frames skip the ogrid/sqrt/power setup.
+# Entries are read-only and the total size is bounded, oldest used go first.
+class ArrayLRU:
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+        value = build()
+        value.setflags(write=False)
+        with self._lock:
+            if key not in self._items and value.nbytes <= self.max_bytes:
+                self._items[key] = value
+                self.nbytes += value.nbytes
+                self._evict()
+        return value
+
+    def resize(self, max_bytes):
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.nbytes = 0
+
+    def _evict(self):
+        while self.nbytes > self.max_bytes and self._items:
+            _, old = self._items.popitem(last=False)
+            self.nbytes -= old.nbytes
+
+    def info(self):
+        return {"entries": len(self._items), "nbytes": self.nbytes, "max_bytes": self.max_bytes,
+                "hits": self.hits, "misses": self.misses}
+
+
+# one budget shared by grids and transfer functions
+CACHE = ArrayLRU(256 * 1024 * 1024)
+
+
+def set_cache_budget(max_bytes):
+    CACHE.resize(max_bytes)
+
+
+# ========== Transfer functions (unshifted rfft layout) ==========
+def _signed_index(n):
+    # fftfreq(n) * n, but in exact integers
+    k = np.arange(n)
+    k[k >= (n + 1)//2] -= n
+    return k
+
+
+def _build_distance(shape, fshape):
+    (rows, cols), (frows, fcols) = shape, fshape
+    # padded bins are rescaled so d0 keeps meaning "cycles per original image"
+    fy = _signed_index(frows)[:, None] * (rows / frows)
+    fx = np.arange(fcols//2 + 1)[None, :] * (cols / fcols)
+    # sqrt in float64 so integer radii stay exact, stored as float32
+    return np.sqrt(fy**2 + fx**2).astype(np.float32)
+
+
+def distance(shape, fshape=None):
+    shape = tuple(shape)
+    fshape = shape if fshape is None else tuple(fshape)
+    return CACHE.get(("D", shape, fshape), lambda: _build_distance(shape, fshape))
+
+
+def _transfer(kind, shape, fshape, d0, n, build):
+    shape = tuple(shape)
+    fshape = shape if fshape is None else tuple(fshape)
+    return CACHE.get((kind, shape, fshape, float(d0), n), lambda: build(distance(shape, fshape)).astype(np.float32))
+
+
+def ilpf(shape, d0, fshape=None):
+    d0 = max(1.0, float(d0))
+    return _transfer("ilpf", shape, fshape, d0, None, lambda D: D <= d0)
+
+
+def ihpf(shape, d0, fshape=None):
+    d0 = float(d0)
+    return _transfer("ihpf", shape, fshape, d0, None, lambda D: D > d0)
+
+
+def blpf(shape, d0, n=2, fshape=None):
+    d0 = float(d0)
+    return _transfer("blpf", shape, fshape, d0, n, lambda D: 1 / (1 + (D / (d0+1e-6))**(2*n)))
+
+
+def bhpf(shape, d0, n=2, fshape=None):
+    d0 = float(d0)
+    return _transfer("bhpf", shape, fshape, d0, n, lambda D: 1 / (1 + (d0 / (D + 1e-6))**(2*n)))
+
+
+def glpf(shape, d0, fshape=None):
+    d0 = max(1.0, float(d0))
+    return _transfer("glpf", shape, fshape, d0, None, lambda D: np.exp(-(D*D) / (2*d0*d0)))
+
+
+def ghpf(shape, d0, fshape=None):
+    d0 = max(1.0, float(d0))
+    return _transfer("ghpf", shape, fshape, d0, None, lambda D: 1 - np.exp(-(D*D) / (2*d0*d0)))
@@ -0,0 +1,136 @@
+# =========================
+# Undo / redo history with compressed snapshots (headless)
+# =========================
+# Every entry keeps a small state object (e.g. the operation stack nodes)
+# plus the image it produced, stored compressed in memory: PNG for 8-bit
+# grayscale/RGB (its row filters beat plain zlib on photos), zlib for
+# anything else. Compression runs on a background thread so committing an
+# operation doesn't wait for it (at most a few raw images wait in line;
+# beyond that push() blocks until one is done, keeping memory bounded).
+# The total compressed size is capped. Past the cap the oldest entries lose
+# their image, not their state: restoring one of those gives image() None
+# and the caller rebuilds the image from the state (the operation stack is
+# replayed, noise ops are seeded so the result is the same). A photo-like
+# 24 MP image compresses to ~36 MB, so only the newest handful of steps
+# keep their pixels; the step count is capped separately (max_steps).
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+
+_compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="undo-compress")
+_in_flight = threading.BoundedSemaphore(4)
+
+
+def compress(img):
+    img = np.ascontiguousarray(img)
+    if img.dtype == np.uint8 and (img.ndim == 2 or (img.ndim == 3 and img.shape[2] in (3, 4))):
+        ok, buf = cv2.imencode(".png", img, [cv2.IMWRITE_PNG_COMPRESSION, 1,
+                                             cv2.IMWRITE_PNG_STRATEGY, cv2.IMWRITE_PNG_STRATEGY_RLE])
+        if ok:
+            return ("png", img.shape, img.dtype.str, buf.tobytes())
+    return ("zlib", img.shape, img.dtype.str, zlib.compress(img.tobytes(), 1))
+
+
+def decompress(packed):
+    kind, shape, dtype, data = packed
+    if kind == "png":
+        img = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_UNCHANGED)
+    else:
+        img = np.frombuffer(zlib.decompress(data), dtype=dtype)
+    return img.reshape(shape)
+
+
+class Snapshot:
+    def __init__(self, state, image, on_compressed=None):
+        self.state = state
+        self._packed = None
+        if image is not None:
+            _in_flight.acquire()
+            self._packed = _compressor.submit(compress, image)
+            self._packed.add_done_callback(lambda _: _in_flight.release())
+            if on_compressed:
+                self._packed.add_done_callback(lambda _: on_compressed())
+
+    @property
+    def nbytes(self):
+        # compressed size; entries still being compressed count once done
+        if self._packed is None or not self._packed.done():
+            return 0
+        return len(self._packed.result()[3])
+
+    def image(self):
+        packed = self._packed
+        return None if packed is None else decompress(packed.result())
+
+    def drop_image(self):
+        self._packed = None
+
+
+class UndoHistory:
+    def __init__(self, max_bytes=256 * 1024 * 1024, max_steps=1000):
+        self.max_bytes = max_bytes
+        self.max_steps = max_steps
+        self._entries = []
+        self._index = -1
+        # re-entrant: a snapshot that finished compressing before push() returns
+        # calls _evict from inside push
+        self._lock = threading.RLock()
+
+    def clear(self):
+        with self._lock:
+            self._entries = []
+            self._index = -1
+
+    def push(self, state, image=None):
+        # record the state after a change; drops any redo branch
+        with self._lock:
+            del self._entries[self._index + 1:]
+        # outside the lock: may wait for the compressor, whose callbacks lock
+        snapshot = Snapshot(state, image, self._evict)
+        with self._lock:
+            self._entries.append(snapshot)
+            self._index = len(self._entries) - 1
+            while len(self._entries) > self.max_steps:
+                self._entries.pop(0)
+                self._index -= 1
+
+    def can_undo(self):
+        return self._index > 0
+
+    def can_redo(self):
+        return self._index < len(self._entries) - 1
+
+    def undo(self):
+        with self._lock:
+            if self._index <= 0:
+                return None
+            self._index -= 1
+            return self._entries[self._index]
+
+    def redo(self):
+        with self._lock:
+            if self._index >= len(self._entries) - 1:
+                return None
+            self._index += 1
+            return self._entries[self._index]
+
+    def nbytes(self):
+        return sum(e.nbytes for e in self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _evict(self):
+        # called whenever a snapshot finishes compressing; drops the oldest
+        # images but keeps the states (and the current entry's image)
+        with self._lock:
+            total = self.nbytes()
+            for i, entry in enumerate(self._entries):
+                if total <= self.max_bytes:
+                    break
+                if i != self._index:
+                    total -= entry.nbytes
+                    entry.drop_image()
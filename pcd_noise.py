@@ -0,0 +1,93 @@
+# =========================
+# Random noise engine (headless)
+# =========================
+# Noise ops add `scale * unit noise` to the image, where the unit noise
+# (standard normal, exponential, uniform, ...) only depends on its kind, the
+# image shape and a seed. Unit buffers are float32 from numpy's Generator
+# API and, for an explicit seed, cached: a slider that only changes the
+# variance / scale rescales the same buffer instead of drawing new numbers
+# every tick, and the same seed always gives the same noise (reproducible
+# datasets, stable undo / redo and history edits).
+#
+# Buffers are drawn in fixed-size chunks, chunk i from PCG64(seed) jumped i
+# times. The chunks are independent streams, so they can be filled on
+# several threads (the Generator fill loops release the GIL) and the result
+# is the same whatever the number of threads.
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from pcd_freq import ArrayLRU
+
+CHUNK = 1 << 20  # values per independently seeded chunk
+WORKERS = os.cpu_count() or 1
+CACHE = ArrayLRU(256 * 1024 * 1024)
+
+
+def new_seed():
+    # fresh 63-bit seed from OS entropy
+    return int(np.random.SeedSequence().generate_state(1, np.uint64)[0] >> 1)
+
+
+def _fill(kind, seed, flat, index):
+    gen = np.random.Generator(np.random.PCG64(seed).jumped(index))
+    out = flat[index * CHUNK:(index + 1) * CHUNK]
+    if kind == "normal":
+        gen.standard_normal(dtype=np.float32, out=out)
+    elif kind == "exponential":
+        gen.standard_exponential(dtype=np.float32, out=out)
+    elif kind == "uniform":  # [0, 1)
+        gen.random(dtype=np.float32, out=out)
+    else:
+        raise ValueError(f"unknown noise kind: {kind}")
+
+
+def draw(kind, shape, seed, workers=None):
+    # seed: anything PCG64 accepts (int or sequence of ints)
+    flat = np.empty(int(np.prod(shape)), dtype=np.float32)
+    chunks = range(-(-flat.size // CHUNK))
+    workers = min(WORKERS if workers is None else workers, len(chunks))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="noise") as pool:
+            list(pool.map(lambda i: _fill(kind, seed, flat, i), chunks))
+    else:
+        for i in chunks:
+            _fill(kind, seed, flat, i)
+    return flat.reshape(shape)
+
+
+def _build(kind, shape, seed, k, workers):
+    if kind == "rayleigh":
+        # Rayleigh(1) = sqrt(2 * Exp(1))
+        out = draw("exponential", shape, seed, workers)
+        out *= 2
+        return np.sqrt(out, out=out)
+    if kind == "erlang":
+        # Erlang(k, 1) = sum of k independent Exp(1), one stream each
+        out = draw("exponential", shape, seed, workers)
+        for term in range(2, k + 1):
+            out += draw("exponential", shape, (seed, term), workers)
+        return out
+    return draw(kind, shape, seed, workers)
+
+
+def unit(kind, shape, seed=None, k=1, workers=None):
+    # kinds: normal, exponential, uniform ([0, 1)), rayleigh, erlang (k terms);
+    # without a seed the noise is fresh every call and not cached
+    shape = tuple(shape)
+    if seed is None:
+        return _build(kind, shape, new_seed(), k, workers)
+    if not isinstance(seed, (int, np.integer)):
+        seed = tuple(int(s) for s in seed)  # [1, 2] from a pipeline spec: hashable key
+    return CACHE.get((kind, shape, seed, k), lambda: _build(kind, shape, seed, k, workers))
+
+
+def add(img, noise, scale=1.0, offset=0.0):
+    # img + scale * noise + offset, clipped and truncated to uint8
+    out = np.multiply(noise, np.float32(scale))
+    if offset:
+        out += np.float32(offset)
+    out += img
+    np.clip(out, 0, 255, out=out)
+    return out.astype(np.uint8)
@@ -0,0 +1,940 @@
+# =========================
+# JPEGirls processing engine (headless)
+# =========================
+# Every operation is a plain function: takes a NumPy image (H x W x 3 RGB uint8
+# or H x W grayscale uint8) plus parameters and returns a new uint8 array.
+# No Tk import here, so this module can be used from worker processes,
+# batch jobs and benchmarks.
+import numpy as np
+import cv2
+from PIL import Image, ImageEnhance, ImageStat
+from scipy import signal
+import math
+import ast
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import groupby
+
+import pcd_freq as freq
+import pcd_noise as noise
+
+
+# ========== Derived views cache ==========
+# Read-only arrays (OpStack results, UI preview proxies) are treated as
+# immutable, so their RGB / gray / float32 conversions are computed once and
+# shared (read-only) by every op and preview tick that needs them. Entries
+# are keyed by the source array and dropped with it; the total size is
+# bounded, oldest sources first. Writable arrays are never cached.
+VIEW_CACHE_BYTES = 256 * 1024 * 1024
+_views = OrderedDict()  # id(source) -> (weakref to source, {kind: array})
+_views_lock = threading.Lock()
+
+
+def _drop_views(key, ref):
+    with _views_lock:
+        entry = _views.get(key)
+        if entry is not None and entry[0] is ref:
+            del _views[key]
+        else:
+            entry = None
+    del entry  # outside the lock, see cached_view
+
+
+def cached_view(img, kind, build):
+    img = np.asarray(img)
+    if img.flags.writeable:
+        return build(img)
+    key = id(img)
+    with _views_lock:
+        entry = _views.get(key)
+        if entry is not None and entry[0]() is img:
+            _views.move_to_end(key)
+            if kind in entry[1]:
+                return entry[1][kind]
+    value = build(img)
+    value.setflags(write=False)
+    # a cached view can itself be a cache key (gray of a cached RGB): dropping
+    # it runs its weakref callback, which takes the lock, so evicted entries
+    # are only released once the lock is free
+    evicted = []
+    with _views_lock:
+        entry = _views.get(key)
+        if entry is None or entry[0]() is not img:
+            evicted.append(entry)
+            entry = _views[key] = (weakref.ref(img, lambda ref, key=key: _drop_views(key, ref)), {})
+        entry[1][kind] = value
+        _views.move_to_end(key)
+        total = sum(a.nbytes for _, arrays in _views.values() for a in arrays.values())
+        while total > VIEW_CACHE_BYTES and len(_views) > 1:
+            _, old = _views.popitem(last=False)
+            evicted.append(old)
+            total -= sum(a.nbytes for a in old[1].values())
+    del evicted
+    return value
+
+
+def clear_views():
+    with _views_lock:
+        evicted = list(_views.values())
+        _views.clear()
+    del evicted
+
+
+# ========== Helpers ==========
+def to_rgb(img):
+    img = np.asarray(img)
+    if img.ndim == 2:
+        return cached_view(img, "rgb", lambda a: cv2.cvtColor(a, cv2.COLOR_GRAY2RGB))
+    return img
+
+
+def _pil_gray(img):
+    # same ITU-R 601-2 luma as PIL convert("L"), so results match the UI
+    return np.array(Image.fromarray(img).convert("L"))
+
+
+def to_gray(img):
+    img = np.asarray(img)
+    if img.ndim == 2:
+        return img
+    return cached_view(img, "gray", _pil_gray)
+
+
+def gray_float32(img):
+    return cached_view(img, "gray_f32", lambda a: to_gray(a).astype(np.float32))
+
+
+def rgb_float32(img):
+    return cached_view(img, "rgb_f32", lambda a: to_rgb(a).astype(np.float32))
+
+
+def normalize(mag, peak=None):
+    peak = mag.max() if peak is None else peak
+    if peak <= 0:
+        return np.zeros(mag.shape, dtype=np.uint8)
+    return np.clip(mag / peak * 255, 0, 255).astype(np.uint8)
+
+
+def _odd(k):
+    k = int(max(1, round(k)))
+    if k % 2 == 0: k += 1
+    return k
+
+
+# ========== BASIC OPS ==========
+# pointwise uint8 ops: the float32 formula is evaluated once for the 256
+# possible levels and applied with a lookup table, so no float copy of the
+# image is made (same results as computing it per pixel)
+_LEVELS = np.arange(256, dtype=np.float32)
+
+
+def _apply_table(img, table):
+    return cv2.LUT(np.asarray(img), np.clip(table, 0, 255).astype(np.uint8))
+
+
+def negative(img, strength=100):
+    strength = strength / 100.0
+    inverted = 255 - _LEVELS
+    return _apply_table(img, _LEVELS + strength * (inverted - _LEVELS))
+
+
+def arithmetic_add(img, value=50):
+    return _apply_table(img, _LEVELS + value)
+
+
+def arithmetic_subtract(img, value=50):
+    return _apply_table(img, _LEVELS - value)
+
+
+def arithmetic_multiply(img, factor=1.0):
+    return _apply_table(img, _LEVELS * factor)
+
+
+def arithmetic_divide(img, factor=1.0):
+    if factor == 0: factor = 1e-3
+    return _apply_table(img, _LEVELS / factor)
+
+
+def boolean_not(img, strength=100):
+    return negative(to_gray(img), strength)
+
+
+def _second_gray(img, other):
+    h, w = np.asarray(img).shape[:2]
+    other = Image.fromarray(np.asarray(other)).convert("L")
+    return np.array(other.resize((w, h)))
+
+
+def boolean_and(img, other):
+    return np.bitwise_and(to_gray(img), _second_gray(img, other))
+
+
+def boolean_or(img, other):
+    return np.bitwise_or(to_gray(img), _second_gray(img, other))
+
+
+def boolean_xor(img, other):
+    return np.bitwise_xor(to_gray(img), _second_gray(img, other))
+
+
+# ========== GEOMETRIC ==========
+def geometric_translation(img, tx=0, ty=0):
+    pil = Image.fromarray(np.asarray(img))
+    mat = (1, 0, int(tx), 0, 1, int(ty))
+    return np.array(pil.transform(pil.size, Image.AFFINE, mat))
+
+
+def geometric_rotation(img, angle=0):
+    return np.array(Image.fromarray(np.asarray(img)).rotate(angle, expand=True))
+
+
+def geometric_zooming(img, factor=1.0):
+    pil = Image.fromarray(np.asarray(img))
+    new_size = (max(1, int(pil.width * factor)), max(1, int(pil.height * factor)))
+    return np.array(pil.resize(new_size, Image.Resampling.LANCZOS))
+
+
+def geometric_flipping(img, direction="horizontal"):
+    img = np.asarray(img)
+    if direction == "horizontal":
+        return img[:, ::-1].copy()
+    if direction == "vertical":
+        return img[::-1].copy()
+    raise ValueError(f"unknown flip direction: {direction}")
+
+
+def geometric_cropping(img, x1=0, y1=0, x2=None, y2=None):
+    pil = Image.fromarray(np.asarray(img))
+    if x2 is None: x2 = pil.width
+    if y2 is None: y2 = pil.height
+    return np.array(pil.crop((x1, y1, x2, y2)))
+
+
+# ========== Convolution engine ==========
+# convolve(img, kernel) gives the same float32 result as
+# ndimage.convolve(img, kernel) (mode="reflect") but runs on OpenCV: rank-1
+# kernels (Prewitt, Sobel, box) as two 1-D passes with sepFilter2D, the rest
+# with filter2D. OpenCV correlates, so kernels are flipped, and the anchor
+# is put where ndimage centres even-sized kernels (Roberts' 2x2 included).
+# Plans are cached per kernel.
+#
+# Large non-separable kernels can be cheaper as FFT convolution (scipy's
+# fftconvolve / oaconvolve on a reflect-padded image). Which of the three
+# wins depends on the kernel size and the machine, so it's measured once per
+# kernel shape on a small sample image and remembered (conv_method).
+FFT_MIN_TAPS = 15 * 15  # smaller kernels always run spatially
+CONV_SAMPLE = 512  # minimum side of the timing sample
+_conv_methods = {}
+@lru_cache(maxsize=64)
+def _conv_plan(shape, values):
+    kernel = np.array(values, dtype=np.float64).reshape(shape)[::-1, ::-1]
+    anchor = ((shape[1] - 1) // 2, (shape[0] - 1) // 2)
+    if min(shape) > 1:
+        i, j = np.unravel_index(np.argmax(np.abs(kernel)), shape)
+        col, row = kernel[:, j], kernel[i, :] / kernel[i, j]
+        if np.allclose(np.outer(col, row), kernel, rtol=1e-6, atol=1e-12):
+            return "separable", (row.astype(np.float32), col.astype(np.float32)), anchor
+    return "full", kernel.astype(np.float32), anchor
+
+
+def conv_plan(kernel):
+    kernel = np.asarray(kernel)
+    return _conv_plan(kernel.shape, tuple(kernel.ravel().tolist()))
+
+
+def _convolve_fft(img, weights, anchor, fn):
+    # correlation with the (already flipped) weights == convolution with the
+    # kernel; the reflect pad reproduces the spatial border handling
+    (ax, ay), (kh, kw) = anchor, weights.shape
+    pad = cv2.copyMakeBorder(img, ay, kh - 1 - ay, ax, kw - 1 - ax, cv2.BORDER_REFLECT)
+    kernel = weights[::-1, ::-1]
+    if img.ndim == 3:
+        kernel = kernel[:, :, None]
+    return fn(pad, kernel, mode="valid", axes=(0, 1)).astype(np.float32, copy=False)
+
+
+def _run_conv(img, kind, weights, anchor, method):
+    if kind == "separable":
+        return cv2.sepFilter2D(img, cv2.CV_32F, weights[0], weights[1], anchor=anchor,
+                               borderType=cv2.BORDER_REFLECT)
+    if method == "fft":
+        return _convolve_fft(img, weights, anchor, signal.fftconvolve)
+    if method == "oa":
+        return _convolve_fft(img, weights, anchor, signal.oaconvolve)
+    return cv2.filter2D(img, cv2.CV_32F, weights, anchor=anchor, borderType=cv2.BORDER_REFLECT)
+
+
+def conv_method(shape):
+    # "spatial", "fft" or "oa" (overlap-add) for a non-separable kernel shape
+    shape = tuple(shape)
+    if shape[0] * shape[1] < FFT_MIN_TAPS:
+        return "spatial"
+    method = _conv_methods.get(shape)
+    if method is None:
+        # the sample has to be large next to the kernel to be representative
+        side = max(CONV_SAMPLE, 4 * max(shape))
+        sample = np.random.default_rng(0).random((side, side), dtype=np.float32)
+        weights = np.ones(shape, dtype=np.float32)
+        anchor = ((shape[1] - 1) // 2, (shape[0] - 1) // 2)
+        timings = {}
+        for candidate in ("spatial", "fft", "oa"):
+            for _ in range(3):  # best of 3, the first run also pays for setup
+                start = time.perf_counter()
+                _run_conv(sample, "full", weights, anchor, candidate)
+                elapsed = time.perf_counter() - start
+                timings[candidate] = min(elapsed, timings.get(candidate, elapsed))
+        best = min(timings, key=timings.get)
+        # FFT only when clearly faster: timings jitter, and spatial results
+        # don't depend on the image size (FFT ones differ in float rounding)
+        method = _conv_methods[shape] = best if timings[best] < 0.8 * timings["spatial"] else "spatial"
+    return method
+
+
+def convolve(img, kernel, method="auto"):
+    # method: "auto" (measured, see conv_method), "spatial", "fft" or "oa"
+    img = np.asarray(img, dtype=np.float32)
+    kind, weights, anchor = conv_plan(kernel)
+    if method == "auto":
+        method = "spatial" if kind == "separable" else conv_method(weights.shape)
+    return _run_conv(img, kind, weights, anchor, method)
+
+
+def max_response(img, kernels, absolute=True):
+    # max over kernels of img * kernel (of |img * kernel| if absolute), kept
+    # as one running in-place maximum instead of a stack of responses
+    out = convolve(img, kernels[0])
+    if absolute:
+        np.abs(out, out=out)
+    for kernel in kernels[1:]:
+        response = convolve(img, kernel)
+        if absolute:
+            np.abs(response, out=response)
+        cv2.max(out, response, dst=out)
+    return out
+
+
+# ========== Kernels ==========
+# custom convolution kernels: typed in (rows on lines or separated by ";",
+# values by commas or spaces), loaded from .npy / text files, or generated
+KERNEL_EXTS = (".npy", ".txt", ".csv")
+
+
+def parse_kernel(text):
+    rows = [row.replace(",", " ").split() for row in text.replace(";", "\n").splitlines()]
+    rows = [row for row in rows if row]
+    if not rows or any(len(row) != len(rows[0]) for row in rows):
+        raise ValueError("kernel rows must all have the same number of values")
+    try:
+        return np.array([[float(v) for v in row] for row in rows], dtype=np.float64)
+    except ValueError:
+        raise ValueError("kernel values must be numbers") from None
+
+
+def load_kernel(path):
+    if path.lower().endswith(".npy"):
+        kernel = np.load(path).astype(np.float64)
+        if kernel.ndim != 2:
+            raise ValueError(f"{path}: kernel must be a 2-D array")
+        return kernel
+    with open(path) as f:
+        return parse_kernel(f.read())
+
+
+def format_kernel(kernel):
+    return "\n".join(" ".join(f"{v:.6g}" for v in row) for row in np.asarray(kernel))
+
+
+def gaussian_kernel(size, sigma=None):
+    size = _odd(size)
+    g = cv2.getGaussianKernel(size, sigma or 0, cv2.CV_64F)
+    return g @ g.T
+
+
+def log_kernel(size, sigma=None):
+    # Laplacian of Gaussian, shifted to sum to 0 (flat areas give 0)
+    size = _odd(size)
+    sigma = sigma or 0.3 * ((size - 1) * 0.5 - 1) + 0.8  # OpenCV's default for a size
+    r = size // 2
+    y, x = np.mgrid[-r:r + 1, -r:r + 1]
+    d2 = (x*x + y*y) / (2 * sigma * sigma)
+    kernel = (d2 - 1) / (math.pi * sigma**4) * np.exp(-d2)
+    return kernel - kernel.mean()
+
+
+def motion_kernel(length, angle=0):
+    # a normalized line of `length` pixels through the centre, `angle` degrees
+    size = _odd(length)
+    kernel = np.zeros((size, size), dtype=np.float64)
+    c = size // 2
+    dx, dy = math.cos(math.radians(angle)) * c, -math.sin(math.radians(angle)) * c
+    cv2.line(kernel, (int(round(c - dx)), int(round(c - dy))), (int(round(c + dx)), int(round(c + dy))), 1.0)
+    return kernel / kernel.sum()
+
+
+KERNEL_GENERATORS = {
+    "gaussian": gaussian_kernel,
+    "log": log_kernel,
+    "motion": motion_kernel,
+}
+
+
+# ========== THRESHOLDING / CONVOLUTION / FOURIER ==========
+def thresholding(img, threshold=127):
+    _, result = cv2.threshold(to_gray(img), int(threshold), 255, cv2.THRESH_BINARY)
+    return result
+
+
+def convolution(img, kernel=None):
+    # without a kernel: the classic 3x3 Laplacian on the gray image; a custom
+    # N x M kernel (see the Kernels section) is applied per channel
+    if kernel is None:
+        kernel = np.array([[-1, -1, -1],
+                           [-1,  8, -1],
+                           [-1, -1, -1]])
+        result = convolve(gray_float32(img), kernel)
+    else:
+        img = np.asarray(img)
+        result = convolve(img, parse_kernel(kernel) if isinstance(kernel, str) else kernel)
+    return np.clip(result, 0, 255).astype(np.uint8)
+
+
+def fourier_transform(img):
+    magnitude_spectrum = 20 * np.log(freq.magnitude_spectrum(to_gray(img)) + 1)
+    return np.clip(magnitude_spectrum, 0, 255).astype(np.uint8)
+
+
+# ========== COLOR OPERATIONS ==========
+def color_binary(img, threshold=127):
+    return thresholding(img, threshold)
+
+
+def color_grayscale(img):
+    return to_gray(img)
+
+
+def color_rgb(img):
+    return to_rgb(img).copy()
+
+
+def color_hsv(img):
+    return cv2.cvtColor(to_rgb(img), cv2.COLOR_RGB2HSV)
+
+
+def color_cmy(img):
+    img_rgb = rgb_float32(img) / 255.0
+    img_cmy = 1.0 - img_rgb
+    return (img_cmy * 255).astype(np.uint8)
+
+
+def color_yuv(img):
+    return cv2.cvtColor(to_rgb(img), cv2.COLOR_RGB2YUV)
+
+
+def color_yiq(img):
+    img_rgb = rgb_float32(img) / 255.0
+    transform_matrix = np.array([[0.299, 0.587, 0.114],
+                                 [0.596, -0.275, -0.321],
+                                 [0.212, -0.523, 0.311]])
+    img_yiq = np.dot(img_rgb, transform_matrix.T)
+    return np.clip(img_yiq * 255, 0, 255).astype(np.uint8)
+
+
+def color_pseudo(img):
+    img_colored = cv2.applyColorMap(to_gray(img), cv2.COLORMAP_JET)
+    return cv2.cvtColor(img_colored, cv2.COLOR_BGR2RGB)
+
+
+# ========== ENHANCEMENT ==========
+def enhance_brightness(img, factor=1.0):
+    return np.array(ImageEnhance.Brightness(Image.fromarray(np.asarray(img))).enhance(factor))
+
+
+def enhance_contrast(img, factor=1.0):
+    return np.array(ImageEnhance.Contrast(Image.fromarray(np.asarray(img))).enhance(factor))
+
+
+def histogram_equalization(img):
+    return cv2.equalizeHist(to_gray(img))
+
+
+def geometric_correction(img):
+    img = rgb_float32(img)
+    p2, p98 = np.percentile(img, (2, 98))
+    return np.clip((img - p2) * 255.0 / (p98 - p2 + 1e-6), 0, 255).astype(np.uint8)
+
+
+# ========== SMOOTHING ==========
+# both run in constant time per pixel whatever k is, so kernel sizes in the
+# hundreds stay interactive: cv2.blur keeps running row / column sums (the
+# separable form of an integral-image box filter), and cv2.medianBlur on
+# uint8 goes from Huang's sliding histogram to the Perreault-Hebert O(1)
+# one once k is past a few pixels
+def smoothing_lowpass(img, k=3):
+    k = _odd(k)
+    return cv2.blur(np.asarray(img), (k, k))
+
+
+def smoothing_median(img, k=3):
+    # per channel, so the channel order doesn't matter (no RGB/BGR round trip)
+    return cv2.medianBlur(np.asarray(img), _odd(k))
+
+
+# frequency filters work per channel (RGB stays RGB) and accept an optional
+# precomputed pcd_freq.Spectrum of img, so callers filtering the same image
+# repeatedly skip the forward FFT
+def _freq_filter(img, transfer, spectrum=None):
+    if spectrum is None:
+        spectrum = freq.Spectrum(img)
+    return spectrum.apply(transfer(spectrum.shape, spectrum.fshape))
+
+
+def smoothing_ilpf(img, d0=30, spectrum=None):
+    return _freq_filter(img, lambda shape, fshape: freq.ilpf(shape, d0, fshape=fshape), spectrum)
+
+
+def smoothing_blpf(img, d0=30, n=2, spectrum=None):
+    return _freq_filter(img, lambda shape, fshape: freq.blpf(shape, d0, n, fshape=fshape), spectrum)
+
+
+def smoothing_glpf(img, d0=30, spectrum=None):
+    return _freq_filter(img, lambda shape, fshape: freq.glpf(shape, d0, fshape=fshape), spectrum)
+
+
+# ========== SHARPENING ==========
+def sharpening_highpass(img):
+    kernel = np.array([[-1,-1,-1],[-1,9,-1],[-1,-1,-1]])
+    res = convolve(gray_float32(img), kernel)
+    return np.clip(res, 0, 255).astype(np.uint8)
+
+
+def sharpening_highboost(img, A=1.5):
+    A = float(A)
+    img = gray_float32(img)
+    blurred = cv2.GaussianBlur(img, (3,3), 0)
+    mask = img - blurred
+    res = img + (A - 1) * mask
+    return np.clip(res, 0, 255).astype(np.uint8)
+
+
+def sharpening_ihpf(img, d0=30, spectrum=None):
+    return _freq_filter(img, lambda shape, fshape: freq.ihpf(shape, d0, fshape=fshape), spectrum)
+
+
+def sharpening_bhpf(img, d0=30, n=2, spectrum=None):
+    return _freq_filter(img, lambda shape, fshape: freq.bhpf(shape, d0, n, fshape=fshape), spectrum)
+
+
+def sharpening_ghpf(img, d0=30, spectrum=None):
+    return _freq_filter(img, lambda shape, fshape: freq.ghpf(shape, d0, fshape=fshape), spectrum)
+
+
+# ========== NOISE ==========
+# seed=None draws fresh noise every call; an explicit seed makes the result
+# reproducible and lets repeated calls rescale one cached unit buffer
+def noise_gaussian(img, var=200, seed=None):
+    img = np.asarray(img)
+    return noise.add(img, noise.unit("normal", img.shape, seed), math.sqrt(var))
+
+
+def noise_rayleigh(img, scale=10.0, seed=None):
+    img = np.asarray(img)
+    return noise.add(img, noise.unit("rayleigh", img.shape, seed), scale)
+
+
+def noise_erlang(img, shape=2, scale=10.0, seed=None):
+    img = np.asarray(img)
+    shape = max(1, int(shape))
+    return noise.add(img, noise.unit("erlang", img.shape, seed, k=shape), scale)
+
+
+def noise_exponential(img, scale=5.0, seed=None):
+    img = np.asarray(img)
+    return noise.add(img, noise.unit("exponential", img.shape, seed), scale)
+
+
+def noise_uniform(img, amount=20, seed=None):
+    img = np.asarray(img)
+    # uniform on [-amount, amount)
+    return noise.add(img, noise.unit("uniform", img.shape, seed), 2 * amount, -amount)
+
+
+def noise_impulse(img, prob=0.05, seed=None):
+    img = np.asarray(img, dtype=np.uint8)
+    out = img.copy()
+    rnd = noise.unit("uniform", img.shape[:2], seed)
+    out[rnd < prob/2] = 0
+    out[(rnd >= prob/2) & (rnd < prob)] = 255
+    return out
+
+
+# ========== EDGE DETECTION ==========
+# most edge ops are a gradient magnitude stretched to 0-255 by its maximum;
+# `peak` replaces that maximum (tiled runs pass the peak of the whole image,
+# see pcd_tiles), MAGNITUDES gives the raw magnitude to find it
+def _sobel_magnitude(img):
+    img = to_gray(img)
+    gx = cv2.Sobel(img, cv2.CV_64F, 1, 0, ksize=3)
+    gy = cv2.Sobel(img, cv2.CV_64F, 0, 1, ksize=3)
+    return np.hypot(gx, gy)
+
+
+def _prewitt_magnitude(img):
+    kernelx = np.array([[ -1,0,1],[-1,0,1],[-1,0,1]])
+    kernely = np.array([[ 1,1,1],[0,0,0],[-1,-1,-1]])
+    img = gray_float32(img)
+    gx = convolve(img, kernelx)
+    gy = convolve(img, kernely)
+    return np.hypot(gx, gy)
+
+
+def _robert_magnitude(img):
+    img = gray_float32(img)
+    gx = convolve(img, np.array([[1,0],[0,-1]]))
+    gy = convolve(img, np.array([[0,1],[-1,0]]))
+    return np.hypot(gx, gy)
+
+
+def _laplacian_magnitude(img):
+    img = gray_float32(img)
+    return np.abs(cv2.Laplacian(img, cv2.CV_32F))
+
+
+def _log_magnitude(img):
+    img = gray_float32(img)
+    blurred = cv2.GaussianBlur(img, (5,5), 0)
+    return np.abs(cv2.Laplacian(blurred, cv2.CV_32F))
+
+
+COMPASS_KERNELS = [
+    np.array([[ -1,-1,2],[-1,-1,2],[-1,-1,2]]),
+    np.array([[ -1,2,2],[-1,-1,2],[-1,-1,-1]]),
+    np.array([[2,2,2],[-1,-1,-1],[-1,-1,-1]]),
+    np.array([[2,2,-1],[2,-1,-1],[-1,-1,-1]])
+]
+
+
+def ring_kernels(weights, center=0):
+    # the 8 rotations, 45 degrees apart, of a 3x3 compass kernel given by its
+    # border weights clockwise from the top-left corner
+    ring = [(0,0), (0,1), (0,2), (1,2), (2,2), (2,1), (2,0), (1,0)]
+    kernels = []
+    for d in range(8):
+        kernel = np.full((3, 3), center)
+        for i, (y, x) in enumerate(ring):
+            kernel[y, x] = weights[(i - d) % 8]
+        kernels.append(kernel)
+    return kernels
+
+
+KIRSCH_KERNELS = ring_kernels((5, 5, 5, -3, -3, -3, -3, -3))
+# the other 4 Robinson directions are these negated: |response| covers them
+ROBINSON_KERNELS = ring_kernels((1, 2, 1, 0, -1, -2, -1, 0))[:4]
+
+
+def _compass_magnitude(img):
+    return max_response(gray_float32(img), COMPASS_KERNELS)
+
+
+def _kirsch_magnitude(img):
+    # the 8 Kirsch responses sum to 0, so their max is never negative
+    return max_response(gray_float32(img), KIRSCH_KERNELS, absolute=False)
+
+
+def _robinson_magnitude(img):
+    return max_response(gray_float32(img), ROBINSON_KERNELS)
+
+
+def edge_sobel(img, peak=None):
+    return normalize(_sobel_magnitude(img), peak)
+
+
+def edge_prewitt(img, peak=None):
+    return normalize(_prewitt_magnitude(img), peak)
+
+
+def edge_robert(img, peak=None):
+    return normalize(_robert_magnitude(img), peak)
+
+
+def edge_laplacian(img, peak=None):
+    return normalize(_laplacian_magnitude(img), peak)
+
+
+def edge_log(img, peak=None):
+    return normalize(_log_magnitude(img), peak)
+
+
+def edge_canny(img, low=100, high=200):
+    return cv2.Canny(to_gray(img), low, high)
+
+
+def edge_compass(img, peak=None):
+    return normalize(_compass_magnitude(img), peak)
+
+
+def edge_kirsch(img, peak=None):
+    return normalize(_kirsch_magnitude(img), peak)
+
+
+def edge_robinson(img, peak=None):
+    return normalize(_robinson_magnitude(img), peak)
+
+
+MAGNITUDES = {
+    "edge_sobel": _sobel_magnitude,
+    "edge_prewitt": _prewitt_magnitude,
+    "edge_robert": _robert_magnitude,
+    "edge_laplacian": _laplacian_magnitude,
+    "edge_log": _log_magnitude,
+    "edge_compass": _compass_magnitude,
+    "edge_kirsch": _kirsch_magnitude,
+    "edge_robinson": _robinson_magnitude,
+}
+
+
+# ========== SEGMENTATION ==========
+def seed_distance(img, x, y):
+    # |I - I(seed)| as uint8; a tolerance only thresholds this map, so it can
+    # be kept and reused while the tolerance changes
+    gray = to_gray(img)
+    h, w = gray.shape
+    if not (0 <= x < w and 0 <= y < h):
+        raise ValueError(f"seed ({x}, {y}) is outside the {w}x{h} image")
+    return cv2.absdiff(gray, np.full_like(gray, gray[y, x]))
+
+
+def grow_region(dist, x, y, tol, connectivity=4):
+    # pixels connected to the seed with dist <= tol, as a bool mask; OpenCV's
+    # scan-line flood fill only touches the region itself
+    if connectivity not in (4, 8):
+        raise ValueError("connectivity must be 4 or 8")
+    h, w = dist.shape
+    if tol < 0:
+        return np.zeros((h, w), dtype=bool)
+    mask = np.zeros((h + 2, w + 2), dtype=np.uint8)
+    flags = connectivity | cv2.FLOODFILL_FIXED_RANGE | cv2.FLOODFILL_MASK_ONLY | (1 << 8)
+    cv2.floodFill(dist, mask, (int(x), int(y)), 0, 0, min(float(tol), 255.0), flags)
+    return mask[1:-1, 1:-1].view(bool)
+
+
+def segmentation_region_growing(img, x, y, tol=10, connectivity=4, seeds=None):
+    # `seeds` adds more (x, y) seeds; each grows with its own seed value and
+    # the result is the union of the regions
+    gray = to_gray(img)
+    region = np.zeros(gray.shape, dtype=bool)
+    for sx, sy in [(x, y)] + [tuple(s) for s in seeds or ()]:
+        region |= grow_region(seed_distance(gray, sx, sy), sx, sy, tol, connectivity)
+    return region.astype(np.uint8) * 255
+
+
+def segmentation_watershed(img):
+    img = cv2.cvtColor(to_rgb(img), cv2.COLOR_RGB2BGR)
+    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    ret, thresh = cv2.threshold(gray,0,255,cv2.THRESH_BINARY_INV+cv2.THRESH_OTSU)
+    kernel = np.ones((3,3), np.uint8)
+    opening = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, kernel, iterations=2)
+    sure_bg = cv2.dilate(opening, kernel, iterations=3)
+    dist_transform = cv2.distanceTransform(opening, cv2.DIST_L2,5)
+    ret2, sure_fg = cv2.threshold(dist_transform, 0.7*dist_transform.max(), 255, 0)
+    sure_fg = np.uint8(sure_fg)
+    unknown = cv2.subtract(sure_bg, sure_fg)
+    ret3, markers = cv2.connectedComponents(sure_fg)
+    markers = markers + 1
+    markers[unknown==255] = 0
+    markers = cv2.watershed(img, markers)
+    img[markers == -1] = [255,0,0]
+    return cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+
+
+# ========== Registry ==========
+# name -> function, used by the UI, the batch CLI and anything else that
+# wants to look an operation up by name
+OPERATIONS = {
+    fn.__name__: fn for fn in [
+        negative, arithmetic_add, arithmetic_subtract, arithmetic_multiply, arithmetic_divide,
+        boolean_not, boolean_and, boolean_or, boolean_xor,
+        geometric_translation, geometric_rotation, geometric_zooming, geometric_flipping, geometric_cropping,
+        thresholding, convolution, fourier_transform,
+        color_binary, color_grayscale, color_rgb, color_hsv, color_cmy, color_yuv, color_yiq, color_pseudo,
+        enhance_brightness, enhance_contrast, histogram_equalization, geometric_correction,
+        smoothing_lowpass, smoothing_median, smoothing_ilpf, smoothing_blpf, smoothing_glpf,
+        sharpening_highpass, sharpening_highboost, sharpening_ihpf, sharpening_bhpf, sharpening_ghpf,
+        noise_gaussian, noise_rayleigh, noise_erlang, noise_exponential, noise_uniform, noise_impulse,
+        edge_sobel, edge_prewitt, edge_robert, edge_laplacian, edge_log, edge_canny, edge_compass,
+        edge_kirsch, edge_robinson,
+        segmentation_region_growing, segmentation_watershed,
+    ]
+}
+
+
+# parameters measured in pixels; they are rescaled when an op runs on a
+# downsampled proxy (UI previews) instead of the full image. Frequency
+# cutoffs (d0) are in cycles per image and need no rescaling.
+PIXEL_PARAMS = {
+    "smoothing_lowpass": ("k",),
+    "smoothing_median": ("k",),
+    "geometric_translation": ("tx", "ty"),
+    "geometric_cropping": ("x1", "y1", "x2", "y2"),
+    "segmentation_region_growing": ("x", "y", "seeds"),
+}
+
+
+def _scale(value, scale):
+    if isinstance(value, (list, tuple)):
+        return type(value)(_scale(v, scale) for v in value)
+    return int(round(value * scale)) if isinstance(value, int) else value * scale
+
+
+def scale_params(name, params, scale):
+    params = dict(params)
+    for key in PIXEL_PARAMS.get(name, ()):
+        value = params.get(key)
+        if value is None:
+            continue
+        params[key] = _scale(value, scale)
+    return params
+
+
+def apply(name, img, **params):
+    try:
+        fn = OPERATIONS[name]
+    except KeyError:
+        raise ValueError(f"unknown operation: {name}") from None
+    return fn(img, **params)
+
+
+# ========== Pipelines ==========
+# a pipeline is an ordered list of (name, params) steps, e.g. parsed from
+# "color_grayscale" "histogram_equalization" "edge_canny:low=50,high=150"
+def resolve(name):
+    if name in OPERATIONS:
+        return name
+    # allow short names like "grayscale" or "canny" when they are unambiguous
+    matches = [n for n in OPERATIONS if n.endswith("_" + name)]
+    if len(matches) == 1:
+        return matches[0]
+    if matches:
+        raise ValueError(f"ambiguous operation '{name}': {', '.join(matches)}")
+    raise ValueError(f"unknown operation: {name}")
+
+
+def _parse_value(text):
+    text = text.strip()
+    if text.startswith("@"):
+        # @path loads a second image, e.g. boolean_and:other=@mask.png, or a
+        # kernel file, e.g. convolution:kernel=@blur.npy
+        if text.lower().endswith(KERNEL_EXTS):
+            return load_kernel(text[1:])
+        return np.array(Image.open(text[1:]).convert("RGB"))
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+
+def _split_args(args):
+    # split on commas outside brackets, so seeds=[(10,20),(30,40)] stays whole
+    items, depth, start = [], 0, 0
+    for i, ch in enumerate(args):
+        if ch in "([{":
+            depth += 1
+        elif ch in ")]}":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            items.append(args[start:i])
+            start = i + 1
+    items.append(args[start:])
+    return [item for item in items if item.strip()]
+
+
+def parse_step(spec):
+    name, _, args = spec.partition(":")
+    params = {}
+    for item in _split_args(args):
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"bad parameter '{item}' in '{spec}' (expected key=value)")
+        params[key.strip()] = _parse_value(value)
+    return resolve(name.strip()), params
+
+
+def run_pipeline(img, steps):
+    # runs of point ops are fused into one lookup-table pass (see run_points)
+    for is_point, group in groupby(steps, key=lambda step: step[0] in POINT_OPS):
+        if is_point:
+            img = run_points(img, list(group))
+        else:
+            for name, params in group:
+                img = apply(name, img, **params)
+    return img
+
+
+# ========== Point-op fusion ==========
+# Point ops map every level to a level, so each one is a 256-entry table
+# (the op evaluated on a 0..255 ramp) and a chain of them composes into one
+# table, applied in a single cv2.LUT pass. The kind says what happens to
+# the channels first: "channel" works per channel, "gray"/"rgb" convert
+# before the table (an RGB -> gray step therefore splits the chain). The
+# contrast table depends on the image mean, so the chain is applied up to
+# there, the mean measured, and fusion continues after it.
+POINT_OPS = {
+    "negative": "channel",
+    "arithmetic_add": "channel",
+    "arithmetic_subtract": "channel",
+    "arithmetic_multiply": "channel",
+    "arithmetic_divide": "channel",
+    "enhance_brightness": "channel",
+    "enhance_contrast": "mean",
+    "thresholding": "gray",
+    "color_binary": "gray",
+    "boolean_not": "gray",
+    "color_cmy": "rgb",
+}
+
+_RAMP = np.arange(256, dtype=np.uint8)[None, :]
+
+
+@lru_cache(maxsize=512)
+def _point_table(name, items):
+    table = apply(name, _RAMP, **dict(items))
+    table = table[0] if table.ndim == 2 else table[0, :, 0]
+    table.setflags(write=False)
+    return table
+
+
+def point_table(name, params=None):
+    return _point_table(name, tuple(sorted((params or {}).items())))
+
+
+def contrast_table(img, factor=1.0):
+    # same as PIL's ImageEnhance.Contrast: blend with the rounded mean of
+    # the grayscale image
+    gray = Image.fromarray(to_gray(img))
+    mean = int(ImageStat.Stat(gray).mean[0] + 0.5)
+    ramp = Image.fromarray(_RAMP)
+    return np.array(Image.blend(Image.new("L", ramp.size, mean), ramp, factor))[0]
+
+
+def _lookup(img, table):
+    return img if table is None else cv2.LUT(img, table)
+
+
+def run_points(img, steps):
+    img = np.asarray(img)
+    table = None  # pending composed table, not applied yet
+    for name, params in steps:
+        kind = POINT_OPS[name]
+        if kind == "mean":
+            img, table = _lookup(img, table), None
+            step = contrast_table(img, **params)
+        else:
+            if kind == "gray" and img.ndim == 3:
+                img, table = to_gray(_lookup(img, table)), None
+            elif kind == "rgb" and img.ndim == 2:
+                img, table = to_rgb(_lookup(img, table)), None
+            step = point_table(name, params)
+        table = step if table is None else step[table]
+    return _lookup(img, table)
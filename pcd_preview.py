@@ -0,0 +1,58 @@
+# =========================
+# Background preview worker
+# =========================
+# Runs a preview function on one worker thread so slider dialogs never block
+# the Tk event loop. Jobs coalesce: submit() replaces whatever is still
+# waiting, and a result is only kept if no newer value was submitted while
+# it was being computed (stale renders are dropped, only the latest slider
+# value ever reaches the canvas). No Tk calls here - the dialog polls
+# take_result() from the Tk thread with root.after.
+import threading
+
+
+class PreviewWorker:
+    def __init__(self, fn):
+        self.fn = fn
+        self._cond = threading.Condition()
+        self._generation = 0
+        self._pending = None
+        self._result = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="preview-worker", daemon=True)
+        self._thread.start()
+
+    def submit(self, value):
+        with self._cond:
+            self._generation += 1
+            self._pending = (self._generation, value)
+            self._cond.notify()
+
+    def take_result(self):
+        # (value, output, error) of the newest finished job, or None
+        with self._cond:
+            result, self._result = self._result, None
+            return result
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._pending = None
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                generation, value = self._pending
+                self._pending = None
+            try:
+                output, error = self.fn(value), None
+            except Exception as e:
+                output, error = None, e
+            with self._cond:
+                # a newer value arrived meanwhile: this render is already stale
+                if generation == self._generation and not self._closed:
+                    self._result = (value, output, error)
@@ -0,0 +1,410 @@
+# =========================
+# JPEGirls HTTP service
+# =========================
+# A local HTTP server (asyncio, stdlib only) exposing every pcd_ops
+# operation, e.g.
+#
+#   python pcd_server.py --port 8080 -j 4
+#   curl --data-binary @foto.jpg "http://127.0.0.1:8080/ops/edge_canny?low=50&high=150" -o edges.png
+#
+# Endpoints:
+#   POST /ops/<name>?k=v&...  body = image bytes (PNG, JPEG, ...), answers PNG
+#                             (or JPEG with format=jpeg); k=v are the op's params
+#   GET  /ops                 operation names
+#   GET  /metrics             latency / throughput / batching counters (JSON)
+#   GET  /health
+#
+# The event loop only parses HTTP; decoding, the operation and encoding run
+# in a worker process pool. While a worker is free a request goes straight
+# to it; once all are busy, requests for the same operation and parameters
+# are micro-batched (collected for a few milliseconds or until the batch is
+# full) and the batch is spread over the pool in a few larger tasks, which
+# saves pickling round trips without leaving workers idle.
+# Request bodies, decoded image sizes and header sizes are all capped.
+import argparse
+import ast
+import asyncio
+import io
+import json
+import os
+import sys
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qsl, urlsplit
+
+import cv2
+import numpy as np
+from PIL import Image
+
+import pcd_ops as ops
+
+WORKERS = os.cpu_count() or 1
+MAX_BODY = 20 * 1024 * 1024  # bytes per request body
+MAX_PIXELS = 40_000_000  # decoded image size
+MAX_HEADER_LINE = 16 * 1024
+MAX_HEADERS = 100
+BATCH_MS = 5  # how long a batch stays open for more requests
+MAX_BATCH = 8
+LATENCY_SAMPLES = 1000  # per operation, for the percentiles
+LINGER_S = 2.0  # max time spent draining a refused body
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 411: "Length Required",
+           413: "Payload Too Large", 431: "Request Header Fields Too Large", 500: "Internal Server Error"}
+FORMATS = {"png": (".png", "image/png", [cv2.IMWRITE_PNG_COMPRESSION, 1]),
+           "jpeg": (".jpg", "image/jpeg", [cv2.IMWRITE_JPEG_QUALITY, 92])}
+
+
+# ========== Worker side ==========
+class ImageTooLarge(Exception):
+    pass
+
+
+def decode(data, max_pixels=MAX_PIXELS):
+    with Image.open(io.BytesIO(data)) as im:
+        # the header is enough to refuse decompression bombs
+        w, h = im.size
+        if w * h > max_pixels:
+            raise ImageTooLarge(f"image is {w}x{h}, more than {max_pixels} pixels")
+        return np.array(im.convert("RGB"))
+
+
+def encode(img, fmt="png"):
+    ext, _, flags = FORMATS[fmt]
+    img = np.asarray(img)
+    if img.ndim == 3:
+        img = cv2.cvtColor(img, cv2.COLOR_RGB2BGR)
+    ok, buf = cv2.imencode(ext, img, flags)
+    if not ok:
+        raise ValueError(f"can't encode result as {fmt}")
+    return buf.tobytes()
+
+
+def process_batch(name, params, bodies, fmt="png", max_pixels=MAX_PIXELS):
+    # runs in a worker process; one (status, payload) per body, never raises
+    results = []
+    for body in bodies:
+        try:
+            results.append((200, encode(ops.apply(name, decode(body, max_pixels), **params), fmt)))
+        except ImageTooLarge as e:
+            results.append((413, str(e).encode()))
+        except Exception as e:
+            results.append((400, f"{type(e).__name__}: {e}".encode()))
+    return results
+
+
+# ========== Metrics ==========
+class Metrics:
+    def __init__(self):
+        self.started = time.monotonic()
+        self.requests = 0
+        self.in_flight = 0
+        self.batches = 0
+        self.batched_images = 0
+        self.ops = defaultdict(lambda: {"requests": 0, "errors": 0, "bytes_in": 0, "bytes_out": 0,
+                                        "latency": deque(maxlen=LATENCY_SAMPLES)})
+
+    def record(self, name, status, seconds, bytes_in, bytes_out):
+        entry = self.ops[name]
+        entry["requests"] += 1
+        entry["errors"] += status != 200
+        entry["bytes_in"] += bytes_in
+        entry["bytes_out"] += bytes_out
+        entry["latency"].append(seconds)
+
+    def snapshot(self):
+        uptime = time.monotonic() - self.started
+        per_op = {}
+        for name, entry in self.ops.items():
+            latency = np.array(entry["latency"]) * 1000
+            per_op[name] = {
+                "requests": entry["requests"], "errors": entry["errors"],
+                "bytes_in": entry["bytes_in"], "bytes_out": entry["bytes_out"],
+                "latency_ms": {"mean": float(latency.mean()), "p50": float(np.percentile(latency, 50)),
+                               "p95": float(np.percentile(latency, 95)), "max": float(latency.max())},
+            }
+        done = sum(entry["requests"] for entry in self.ops.values())
+        return {
+            "uptime_s": uptime, "requests": self.requests, "in_flight": self.in_flight,
+            "images_per_s": done / uptime if uptime > 0 else 0.0,
+            "batches": self.batches,
+            "mean_batch_size": self.batched_images / self.batches if self.batches else 0.0,
+            "ops": per_op,
+        }
+
+
+# ========== Micro-batching ==========
+class Batcher:
+    def __init__(self, run, window_ms=BATCH_MS, max_batch=MAX_BATCH, idle=None):
+        # run(job, bodies) submits the work and returns an awaitable list of
+        # results, one per body; idle() > 0 means a worker is free right now
+        self.run = run
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self.idle = idle
+        self._open = {}  # key -> (job, bodies, futures, timer)
+
+    def submit(self, key, job, body):
+        # requests with the same (hashable) key share a batch; job is what
+        # run() gets for it, e.g. the op name and its parsed params
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._open.get(key)
+        if batch is None and self.idle is not None and self.idle() > 0:
+            # waiting for company would only add latency
+            self._start(job, [body], [future])
+            return future
+        if batch is None:
+            batch = self._open[key] = (job, [], [], loop.call_later(self.window, self._flush, key))
+        batch[1].append(body)
+        batch[2].append(future)
+        if len(batch[1]) >= self.max_batch:
+            self._flush(key)
+        return future
+
+    def _flush(self, key):
+        job, bodies, futures, timer = self._open.pop(key)
+        timer.cancel()
+        self._start(job, bodies, futures)
+
+    def _start(self, job, bodies, futures):
+        # run() submits right away, so idle() is current for the next request
+        try:
+            pending = self.run(job, bodies)
+        except Exception as e:  # e.g. a broken pool
+            pending = e
+        asyncio.ensure_future(self._deliver(pending, futures))
+
+    async def _deliver(self, pending, futures):
+        try:
+            if isinstance(pending, Exception):
+                raise pending
+            results = await pending
+        except Exception as e:  # e.g. a worker process died
+            results = [(500, f"{type(e).__name__}: {e}".encode())] * len(futures)
+        for future, result in zip(futures, results):
+            if not future.done():
+                future.set_result(result)
+
+
+# ========== HTTP ==========
+class HTTPError(Exception):
+    def __init__(self, status, message="", unread=0):
+        super().__init__(message)
+        self.status = status
+        self.unread = unread  # body bytes still on the wire
+
+
+def parse_value(text):
+    # like pipeline specs, but never "@path" (no server-side file access)
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+
+class Server:
+    def __init__(self, workers=None, max_body=MAX_BODY, max_pixels=MAX_PIXELS,
+                 batch_ms=BATCH_MS, max_batch=MAX_BATCH):
+        self.workers = WORKERS if workers is None else workers
+        self.max_body = max_body
+        self.max_pixels = max_pixels
+        self.metrics = Metrics()
+        self.batcher = Batcher(self._run_batch, batch_ms, max_batch, self.idle_workers)
+        self._busy = 0  # tasks submitted to the pool and not finished
+        self.pool = None
+        self.server = None
+        self.port = None
+
+    async def start(self, host="127.0.0.1", port=8080):
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        self.server = await asyncio.start_server(self._handle, host, port, limit=MAX_HEADER_LINE)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+    def idle_workers(self):
+        return self.workers - self._busy
+
+    def _run_batch(self, job, bodies):
+        # spread the batch evenly over the pool: run by one worker it would
+        # be serial while the others sit idle
+        name, params, fmt = job
+        loop = asyncio.get_running_loop()
+        size = -(-len(bodies) // self.workers)
+        tasks = []
+        for i in range(0, len(bodies), size):
+            task = loop.run_in_executor(self.pool, process_batch, name, params, bodies[i:i + size], fmt,
+                                        self.max_pixels)
+            self._busy += 1
+            task.add_done_callback(self._task_done)
+            tasks.append(task)
+        self.metrics.batches += len(tasks)
+        self.metrics.batched_images += len(bodies)
+        return self._gather(tasks)
+
+    def _task_done(self, _):
+        self._busy -= 1
+
+    @staticmethod
+    async def _gather(tasks):
+        return [result for part in await asyncio.gather(*tasks) for result in part]
+
+    async def _read_request(self, reader):
+        try:
+            line = await reader.readline()
+        except ValueError:  # longer than the stream limit
+            raise HTTPError(431, "request line too long") from None
+        if not line:
+            return None
+        try:
+            method, target, version = line.decode("latin-1").split()
+        except ValueError:
+            raise HTTPError(400, "malformed request line") from None
+        headers = {}
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                raise HTTPError(431, "header line too long") from None
+            if line in (b"\r\n", b"\n", b""):
+                break
+            if len(headers) >= MAX_HEADERS:
+                raise HTTPError(431, "too many headers")
+            key, _, value = line.decode("latin-1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+        body = b""
+        if method == "POST":
+            if "content-length" not in headers:
+                raise HTTPError(411, "Content-Length required")
+            value = headers["content-length"]
+            # digits only: int() would also take "-5", "+5" or "1_000"
+            if not (value.isascii() and value.isdigit()):
+                raise HTTPError(400, f"bad Content-Length: {value!r}")
+            length = int(value)
+            if length > self.max_body:
+                raise HTTPError(413, f"body is {length} bytes, limit is {self.max_body}", unread=length)
+            body = await reader.readexactly(length)
+        return method, target, version, headers, body
+
+    async def _dispatch(self, method, target, body):
+        # -> (status, content type, payload)
+        url = urlsplit(target)
+        path = url.path.rstrip("/")
+        if path == "/health":
+            return 200, "text/plain", b"ok"
+        if path == "/metrics":
+            return 200, "application/json", json.dumps(self.metrics.snapshot(), indent=1).encode()
+        if path == "/ops":
+            return 200, "application/json", json.dumps(list(ops.OPERATIONS)).encode()
+        if not path.startswith("/ops/"):
+            raise HTTPError(404, f"no such endpoint: {path}")
+        name = path[len("/ops/"):]
+        if name not in ops.OPERATIONS:
+            raise HTTPError(404, f"unknown operation: {name}")
+        if method != "POST":
+            raise HTTPError(405, "use POST with the image as the body")
+        params = {key: parse_value(value) for key, value in parse_qsl(url.query)}
+        fmt = str(params.pop("format", "png")).lower().replace("jpg", "jpeg")
+        if fmt not in FORMATS:
+            raise HTTPError(400, f"format must be one of {', '.join(FORMATS)}")
+        # the key only groups requests (repr: values may be lists, e.g.
+        # kernels); the worker gets the parsed params themselves
+        key = (name, repr(sorted(params.items())), fmt)
+        start = time.perf_counter()
+        self.metrics.in_flight += 1
+        try:
+            status, payload = await self.batcher.submit(key, (name, params, fmt), body)
+        finally:
+            self.metrics.in_flight -= 1
+        self.metrics.record(name, status, time.perf_counter() - start, len(body), len(payload))
+        if status != 200:
+            raise HTTPError(status, payload.decode(errors="replace"))
+        return 200, FORMATS[fmt][1], payload
+
+    async def _linger(self, reader, length):
+        # a client still uploading a refused body would get a reset instead
+        # of the error if the socket closed now: discard the rest, for a while
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + LINGER_S
+        while length > 0:
+            try:
+                chunk = await asyncio.wait_for(reader.read(min(length, 1 << 16)), deadline - loop.time())
+            except asyncio.TimeoutError:
+                return
+            if not chunk:
+                return
+            length -= len(chunk)
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                keep_alive, unread = False, 0
+                try:
+                    request = await self._read_request(reader)
+                    if request is None:
+                        break
+                    method, target, version, headers, body = request
+                    self.metrics.requests += 1
+                    keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                    status, ctype, payload = await self._dispatch(method, target, body)
+                except HTTPError as e:
+                    status, ctype, payload = e.status, "text/plain", (str(e) or REASONS[e.status]).encode()
+                    # a refused body may still be on the wire: don't reuse the connection
+                    keep_alive = keep_alive and e.status not in (411, 413, 431)
+                    unread = e.unread
+                writer.write(f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                             f"Content-Type: {ctype}\r\nContent-Length: {len(payload)}\r\n"
+                             f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + payload)
+                await writer.drain()
+                if unread:
+                    await self._linger(reader, unread)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Serve JPEGirls operations over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("-j", "--workers", type=int, default=WORKERS, help="worker processes (default: all cores)")
+    parser.add_argument("--max-mb", type=float, default=MAX_BODY / 1024 / 1024, help="request body limit in MB")
+    parser.add_argument("--max-mp", type=float, default=MAX_PIXELS / 1e6, help="decoded image limit in megapixels")
+    parser.add_argument("--batch-ms", type=float, default=BATCH_MS, help="micro-batch window in milliseconds")
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH, help="images per batch at most")
+    return parser
+
+
+async def serve(args):
+    server = Server(args.workers, int(args.max_mb * 1024 * 1024), int(args.max_mp * 1e6),
+                    args.batch_ms, args.max_batch)
+    await server.start(args.host, args.port)
+    print(f"serving {len(ops.OPERATIONS)} operations on http://{args.host}:{server.port} "
+          f"({server.workers} workers)", file=sys.stderr)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
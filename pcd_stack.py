@@ -0,0 +1,128 @@
+# =========================
+# Non-destructive operation stack (headless)
+# =========================
+# The processed image is source -> node 1 -> node 2 -> ... where every node
+# is an operation name + params from pcd_ops (run through pcd_tiles.apply, so
+# strip-parallel where possible). Each node's output is cached; editing or
+# removing node k only invalidates k..n, and those are recomputed lazily
+# (from the last still-valid result) the next time result() is asked.
+# Changes to an earlier node can break a later one (a seed outside an image
+# that is now smaller); checked() tries a change on a copy first.
+# Consecutive point ops are recomputed as one fused lookup table; only the
+# last node of such a run gets a cache entry then.
+# Cached arrays are read-only since they are shared with previews.
+from itertools import groupby
+
+import numpy as np
+
+import pcd_ops as ops
+import pcd_tiles as tiles
+
+
+class Node:
+    def __init__(self, name, params=None):
+        self.name = name
+        self.params = dict(params or {})
+
+    def label(self):
+        parts = []
+        for key, value in self.params.items():
+            if key == "kernel" and value is not None and not isinstance(value, str):
+                value = "x".join(map(str, np.shape(value)))
+            elif isinstance(value, np.ndarray):
+                value = "<image>"
+            elif isinstance(value, float):
+                value = f"{value:g}"
+            parts.append(f"{key}={value}")
+        return self.name + (f" ({', '.join(parts)})" if parts else "")
+
+
+class OpStack:
+    def __init__(self, source=None):
+        self.nodes = []
+        self._cache = []
+        self.source = None
+        if source is not None:
+            self.reset(source)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def reset(self, source):
+        self.source = _readonly(source)
+        self.nodes = []
+        self._cache = []
+
+    def push(self, name, params=None, result=None):
+        # result may be passed in when the caller already computed it
+        self.nodes.append(Node(name, params))
+        self._cache.append(None if result is None else _readonly(result))
+
+    def update(self, index, params, result=None):
+        self.nodes[index].params = dict(params)
+        self.invalidate(index)
+        if result is not None:
+            self._cache[index] = _readonly(result)
+
+    def remove(self, index):
+        del self.nodes[index]
+        del self._cache[index]
+        self.invalidate(index)
+
+    def copy(self):
+        # shares the (read-only) cached results, nodes are copied
+        other = OpStack()
+        other.source = self.source
+        other.nodes = self.snapshot()
+        other._cache = list(self._cache)
+        return other
+
+    def checked(self, change):
+        # apply change(stack) to a copy and recompute it; the change is only
+        # adopted if every node still runs, otherwise the op's error is raised
+        # and this stack is left as it was
+        trial = self.copy()
+        change(trial)
+        trial.result()
+        self.nodes, self._cache = trial.nodes, trial._cache
+
+    def snapshot(self):
+        return [Node(n.name, n.params) for n in self.nodes]
+
+    def restore(self, nodes, result=None):
+        # back to a snapshot() state; `result` (the image it produced) seeds
+        # the cache of the last node so nothing has to be recomputed
+        self.nodes = [Node(n.name, n.params) for n in nodes]
+        self._cache = [None] * len(self.nodes)
+        if result is not None and self.nodes:
+            self._cache[-1] = _readonly(result)
+
+    def invalidate(self, index=0):
+        for i in range(index, len(self._cache)):
+            self._cache[i] = None
+
+    def result(self, upto=None):
+        # image after the first `upto` nodes (the whole stack by default),
+        # so result(k) is the input of node k
+        n = len(self.nodes) if upto is None else upto
+        start = n
+        while start > 0 and self._cache[start-1] is None:
+            start -= 1
+        img = self.source if start == 0 else self._cache[start-1]
+        for is_point, group in groupby(range(start, n), key=lambda i: self.nodes[i].name in ops.POINT_OPS):
+            group = list(group)
+            if is_point:
+                img = _readonly(ops.run_points(img, [(self.nodes[i].name, self.nodes[i].params) for i in group]))
+                self._cache[group[-1]] = img
+                continue
+            for i in group:
+                node = self.nodes[i]
+                img = _readonly(tiles.apply(node.name, img, **node.params))
+                self._cache[i] = img
+        return img
+
+
+def _readonly(arr):
+    arr = np.asarray(arr)
+    arr.setflags(write=False)
+    return arr
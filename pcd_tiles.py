@@ -0,0 +1,300 @@
+# =========================
+# Tiled, out-of-core processing (headless)
+# =========================
+# For scans larger than RAM: the source is a memory-mapped uint8 array
+# (.npy, or an image file decoded once into one) and every operation runs
+# on overlapping tiles whose results go into a memory-mapped output, so
+# peak memory is a few tiles whatever the image size, e.g.
+#
+#   python pcd_tiles.py scan.tif out.npy -p "smoothing_median:k=5" -p edge_sobel
+#
+# Each tile is read with a halo of extra pixels on every side (clipped at
+# the image border), processed and cropped back. The halo is at least the
+# op's kernel radius, so interior pixels see the same neighbourhood as in
+# the full image and border pixels get the op's own border handling: the
+# output is identical to running the op in memory. Edge ops stretched by
+# the image maximum take two passes, the first one only finds that peak.
+#
+# The same halo logic splits in-memory images into horizontal strips that
+# run concurrently on a thread pool (the OpenCV / SciPy / NumPy kernels
+# release the GIL), which is how the UI and OpStack use all cores.
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import numpy as np
+from PIL import Image
+
+import pcd_ops as ops
+
+TILE = 1024
+STRIP = 256  # rows per chunk when decoding an image file into a memmap
+# threads for strip-parallel runs; below MIN_PIXELS splitting isn't worth it
+WORKERS = os.cpu_count() or 1
+MIN_PIXELS = 512 * 512
+
+
+def _pointwise(params):
+    return 0
+
+
+def _window(params):
+    # radius of a k x k window (k rounded up to odd like the ops do)
+    return int(max(1, round(params.get("k", 3)))) // 2
+
+
+def _kernel(params):
+    # custom convolution kernel: as far as it reaches from its anchor
+    kernel = params.get("kernel")
+    if kernel is None:
+        return 1
+    if isinstance(kernel, str):
+        kernel = ops.parse_kernel(kernel)
+    return max(np.shape(kernel)) // 2
+
+
+# operation -> halo radius for its parameters
+TILED_OPS = {
+    "negative": _pointwise,
+    "arithmetic_add": _pointwise,
+    "arithmetic_subtract": _pointwise,
+    "arithmetic_multiply": _pointwise,
+    "arithmetic_divide": _pointwise,
+    "thresholding": _pointwise,
+    "color_grayscale": _pointwise,
+    "color_binary": _pointwise,
+    "smoothing_lowpass": _window,
+    "smoothing_median": _window,
+    "convolution": _kernel,
+    "sharpening_highpass": lambda params: 1,
+    "sharpening_highboost": lambda params: 1,
+    "edge_sobel": lambda params: 1,
+    "edge_prewitt": lambda params: 1,
+    "edge_robert": lambda params: 1,
+    "edge_laplacian": lambda params: 1,
+    "edge_log": lambda params: 3,  # 5x5 Gaussian, then 3x3 Laplacian
+    "edge_compass": lambda params: 1,
+    "edge_kirsch": lambda params: 1,
+    "edge_robinson": lambda params: 1,
+}
+
+
+def halo(name, params):
+    try:
+        return TILED_OPS[name](params)
+    except KeyError:
+        raise ValueError(f"{name} can't run tiled (supported: {', '.join(TILED_OPS)})") from None
+
+
+def tile_boxes(shape, tile=TILE):
+    rows, cols = shape[:2]
+    for y in range(0, rows, tile):
+        for x in range(0, cols, tile):
+            yield y, min(y + tile, rows), x, min(x + tile, cols)
+
+
+def strip_boxes(shape, count):
+    rows, cols = shape[:2]
+    edges = np.linspace(0, rows, max(1, count) + 1).astype(int)
+    for y0, y1 in zip(edges[:-1], edges[1:]):
+        if y1 > y0:
+            yield y0, y1, 0, cols
+
+
+def read_tile(src, box, margin):
+    # copy of the box plus `margin` pixels around it, and the slices that
+    # cut the box back out of the result
+    y0, y1, x0, x1 = box
+    rows, cols = src.shape[:2]
+    ry0, rx0 = max(0, y0 - margin), max(0, x0 - margin)
+    ry1, rx1 = min(rows, y1 + margin), min(cols, x1 + margin)
+    return np.array(src[ry0:ry1, rx0:rx1]), (slice(y0 - ry0, y1 - ry0), slice(x0 - rx0, x1 - rx0))
+
+
+def _allocate(path, shape):
+    if path is None:
+        return np.empty(shape, dtype=np.uint8)
+    return np.lib.format.open_memmap(path, mode="w+", dtype=np.uint8, shape=shape)
+
+
+def _tile_result(src, name, params, margin, box):
+    data, inner = read_tile(src, box, margin)
+    return box, ops.apply(name, data, **params)[inner]
+
+
+def _tile_magnitude(src, name, margin, box):
+    data, inner = read_tile(src, box, margin)
+    return box, ops.MAGNITUDES[name](data)[inner]
+
+
+def _map(fn, items, workers):
+    # in order, like map(); concurrent on a thread pool when workers > 1.
+    # At most 2 * workers tiles are in flight, so finished tiles don't pile
+    # up when the consumer (the memmap writer) is slower than the workers
+    if workers <= 1:
+        yield from map(fn, items)
+        return
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tile") as pool:
+        pending = deque()
+        try:
+            for item in items:
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+                pending.append(pool.submit(fn, item))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def run_boxes(src, name, params, boxes, out_path=None, workers=1):
+    # out_path: .npy file for a memory-mapped result (in memory if None)
+    params = dict(params or {})
+    margin = halo(name, params)
+    boxes = list(boxes)
+    if name in ops.MAGNITUDES and params.get("peak") is None:
+        magnitudes = _map(partial(_tile_magnitude, src, name, margin), boxes, workers)
+        if out_path is None:
+            # in memory the magnitudes can simply be kept for the stretch
+            return _stretch(src.shape[:2], list(magnitudes), workers)
+        params["peak"] = max(float(mag.max()) for _, mag in magnitudes)
+    out = None
+    for box, result in _map(partial(_tile_result, src, name, params, margin), boxes, workers):
+        if out is None:
+            # gray or RGB depends on the op, known after the first tile
+            out = _allocate(out_path, src.shape[:2] + result.shape[2:])
+        out[box[0]:box[1], box[2]:box[3]] = result
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
+
+
+def _stretch(shape, magnitudes, workers):
+    peak = max(float(mag.max()) for _, mag in magnitudes)
+    out = np.empty(shape, dtype=np.uint8)
+    for (y0, y1, x0, x1), result in _map(lambda part: (part[0], ops.normalize(part[1], peak)), magnitudes, workers):
+        out[y0:y1, x0:x1] = result
+    return out
+
+
+def run_tiled(src, name, params=None, out_path=None, tile=TILE, workers=1):
+    return run_boxes(src, name, params, tile_boxes(src.shape, tile), out_path, workers)
+
+
+def run_parallel(img, name, params=None, workers=None):
+    # in-memory image, split into about two halo-padded strips per worker
+    # (at least 32 rows each so the halos stay a small overhead)
+    workers = WORKERS if workers is None else workers
+    count = min(2 * workers, max(1, img.shape[0] // 32))
+    return run_boxes(img, name, params, strip_boxes(img.shape, count), workers=workers)
+
+
+def apply(name, img, **params):
+    # drop-in for ops.apply that goes strip-parallel when it can pay off
+    img = np.asarray(img)
+    if WORKERS > 1 and name in TILED_OPS and img.shape[0] * img.shape[1] >= MIN_PIXELS:
+        return run_parallel(img, name, params)
+    return ops.apply(name, img, **params)
+
+
+def run_tiled_pipeline(src, steps, out_path=None, tile=TILE, workdir=None, workers=1):
+    # intermediate results live in temporary .npy files, each one deleted
+    # as soon as the next step has consumed it
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        prev_path = None
+        for i, (name, params) in enumerate(steps):
+            path = out_path if i == len(steps) - 1 else os.path.join(tmp, f"step{i}.npy")
+            src = run_tiled(src, name, params, path, tile, workers)
+            if prev_path:
+                os.remove(prev_path)
+            prev_path = None if path == out_path else path
+    return src
+
+
+# ========== Files ==========
+def load_memmap(path, dst):
+    # decode an image file into a uint8 .npy memmap, strip by strip (PIL
+    # still decodes the file once in its own 8-bit buffer, never as float)
+    Image.MAX_IMAGE_PIXELS = None  # huge scans are the point of this module
+    with Image.open(path) as im:
+        mode = "L" if im.mode in ("1", "L", "I;16", "I", "F") else "RGB"
+        w, h = im.size
+        out = np.lib.format.open_memmap(dst, mode="w+", dtype=np.uint8,
+                                        shape=(h, w) if mode == "L" else (h, w, 3))
+        for y in range(0, h, STRIP):
+            out[y:y + STRIP] = np.asarray(im.crop((0, y, w, min(h, y + STRIP))).convert(mode))
+    out.flush()
+    return out
+
+
+def open_source(path, workdir):
+    if path.lower().endswith(".npy"):
+        return np.load(path, mmap_mode="r")
+    return load_memmap(path, os.path.join(workdir, "source.npy"))
+
+
+def save(arr, path):
+    if path.lower().endswith(".npy"):
+        np.save(path, arr)
+    else:
+        # image encoders need the whole (uint8) result in memory once
+        Image.MAX_IMAGE_PIXELS = None
+        Image.fromarray(np.asarray(arr)).save(path)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Run a JPEGirls pipeline tile by tile on an image larger than RAM.")
+    parser.add_argument("input", nargs="?", help="input image or .npy array")
+    parser.add_argument("output", nargs="?", help="output .npy (memory-mapped) or image file")
+    parser.add_argument("-p", "--op", dest="ops", action="append", default=[], metavar="NAME[:k=v,...]",
+                        help="operation step, repeat in order")
+    parser.add_argument("--tile", type=int, default=TILE, help=f"tile size in pixels (default: {TILE})")
+    parser.add_argument("-j", "--workers", type=int, default=WORKERS,
+                        help="threads processing tiles concurrently (default: all cores)")
+    parser.add_argument("--workdir", default=None, help="directory for temporary memmaps (default: system temp)")
+    parser.add_argument("--list-ops", action="store_true", help="print operations that can run tiled and exit")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.list_ops:
+        print("\n".join(TILED_OPS))
+        return 0
+    if not args.input or not args.output:
+        parser.error("input and output are required")
+    try:
+        steps = [ops.parse_step(spec) for spec in args.ops]
+        for name, params in steps:
+            halo(name, params)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    if not steps:
+        print("error: no operations given (use -p NAME)", file=sys.stderr)
+        return 2
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(dir=args.workdir) as tmp:
+        src = open_source(args.input, tmp)
+        direct = args.output.lower().endswith(".npy")
+        result = run_tiled_pipeline(src, steps, args.output if direct else os.path.join(tmp, "result.npy"),
+                                    args.tile, tmp, args.workers)
+        if not direct:
+            save(result, args.output)
+        del src, result
+    rows, cols = np.load(args.output, mmap_mode="r").shape[:2] if direct else Image.open(args.output).size[::-1]
+    wall = time.perf_counter() - start
+    print(f"{len(steps)} step(s) on {cols}x{rows} in {wall:.2f} s "
+          f"({rows * cols / 1e6 / wall:.1f} MP/s, {args.tile}px tiles, {args.workers} workers)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
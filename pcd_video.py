@@ -0,0 +1,259 @@
+# =========================
+# JPEGirls video / image-sequence mode
+# =========================
+# Streams the frames of a video file, a camera or a numbered image
+# sequence through an operation pipeline, e.g.
+#
+#   python pcd_video.py capture.mp4 out.mp4 -p grayscale -p "edge_canny:low=50,high=150"
+#   python pcd_video.py "frames/img_%04d.png" out/ -p smoothing_median:k=5 -j 4
+#
+# A reader thread decodes ahead into a bounded queue (so memory stays at a
+# few frames), N worker threads run the pipeline and the writer takes the
+# results back in frame order. Workers are threads, not processes: OpenCV,
+# NumPy and the FFTs release the GIL, and every frame shares this process'
+# per-resolution caches (frequency masks, fused point-op LUTs) instead of
+# rebuilding them per frame.
+import argparse
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+from PIL import Image
+
+import pcd_ops as ops
+from pcd_batch import collect_inputs
+
+VIDEO_EXTS = (".mp4", ".avi", ".mov", ".mkv", ".m4v", ".webm")
+FOURCC = {".mp4": "mp4v", ".m4v": "mp4v", ".mov": "mp4v", ".avi": "MJPG", ".mkv": "XVID", ".webm": "VP80"}
+WORKERS = os.cpu_count() or 1
+QUEUE = 8  # frames decoded ahead / in flight
+DEFAULT_FPS = 25.0
+
+
+# ========== Sources ==========
+def _read_capture(cap):
+    try:
+        while True:
+            ok, frame = cap.read()
+            if not ok:
+                return
+            yield cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    finally:
+        cap.release()
+
+
+def _read_files(files):
+    for path in files:
+        with Image.open(path) as im:
+            yield np.array(im.convert("RGB"))
+
+
+def open_source(path):
+    # -> (RGB frame iterator, fps or None, frame count or None). path is a
+    # video file, a camera index ("0"), a directory / glob of images or a
+    # printf pattern like frames/img_%04d.png
+    if os.path.isdir(path) or any(ch in path for ch in "*?["):
+        files = collect_inputs([path])
+        if not files:
+            raise ValueError(f"no images found in {path}")
+        return _read_files(files), None, len(files)
+    cap = cv2.VideoCapture(int(path) if path.isdigit() else path)
+    if not cap.isOpened():
+        raise ValueError(f"can't open video source: {path}")
+    fps = cap.get(cv2.CAP_PROP_FPS) or None
+    count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) or None
+    return _read_capture(cap), fps, (None if path.isdigit() else count)
+
+
+# ========== Sinks ==========
+class VideoSink:
+    def __init__(self, path, fps, fourcc=None):
+        self.path = path
+        self.fps = fps
+        self.fourcc = fourcc or FOURCC.get(os.path.splitext(path)[1].lower(), "mp4v")
+        self.writer = None
+
+    def write(self, frame):
+        frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR if frame.ndim == 2 else cv2.COLOR_RGB2BGR)
+        if self.writer is None:
+            # the size is only known once the pipeline produced a frame
+            h, w = frame.shape[:2]
+            self.writer = cv2.VideoWriter(self.path, cv2.VideoWriter_fourcc(*self.fourcc), self.fps, (w, h))
+            if not self.writer.isOpened():
+                raise ValueError(f"can't write {self.path} with codec {self.fourcc}")
+        self.writer.write(frame)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.release()
+
+
+class SequenceSink:
+    # numbered image files: a printf pattern (out/img_%04d.png) or a directory
+    def __init__(self, path, ext=".png"):
+        if "%" not in path:
+            os.makedirs(path, exist_ok=True)
+            path = os.path.join(path, "%06d" + ext)
+        else:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.pattern = path
+        self.index = 0
+
+    def write(self, frame):
+        Image.fromarray(frame).save(self.pattern % self.index)
+        self.index += 1
+
+    def close(self):
+        pass
+
+
+def open_sink(path, fps, fourcc=None, ext=".png"):
+    if os.path.splitext(path)[1].lower() in VIDEO_EXTS:
+        return VideoSink(path, fps or DEFAULT_FPS, fourcc)
+    return SequenceSink(path, ext)
+
+
+# ========== Streaming ==========
+def _process(steps, frame):
+    # read-only, so ops share the frame's cached gray / float views
+    frame.setflags(write=False)
+    start = time.perf_counter()
+    result = ops.run_pipeline(frame, steps)
+    return result, time.perf_counter() - start
+
+
+def run_stream(frames, steps, write, workers=None, queue_size=QUEUE, progress=None, stop=None):
+    # frames: iterable of RGB arrays; write(result) is called in frame order.
+    # progress(done, fps) is called after every written frame; setting the
+    # `stop` event ends the stream early. Returns a summary dict.
+    workers = WORKERS if workers is None else max(1, workers)
+    stop = stop or threading.Event()
+    pending = queue.Queue(maxsize=max(1, queue_size))
+    done_reading = object()
+    start = time.perf_counter()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                pending.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="frame") as pool:
+        def reader():
+            try:
+                for frame in frames:
+                    if not put(pool.submit(_process, steps, frame)):
+                        return
+                put(done_reading)
+            except Exception as e:
+                put(e)
+
+        thread = threading.Thread(target=reader, name="frame-reader", daemon=True)
+        thread.start()
+        count, busy = 0, 0.0
+        try:
+            while not stop.is_set():
+                try:
+                    item = pending.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if item is done_reading:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                result, seconds = item.result()
+                write(result)
+                count += 1
+                busy += seconds
+                if progress:
+                    progress(count, count / (time.perf_counter() - start))
+        finally:
+            # unblock and end the reader, drop frames still queued
+            stop.set()
+            while thread.is_alive():
+                try:
+                    item = pending.get_nowait()
+                    if hasattr(item, "cancel"):
+                        item.cancel()
+                except queue.Empty:
+                    thread.join(0.05)
+    wall = time.perf_counter() - start
+    return {
+        "frames": count, "workers": workers, "wall_s": wall,
+        "fps": count / wall if wall > 0 else 0.0,
+        "mean_ms_per_frame": busy / max(1, count) * 1000,
+    }
+
+
+def run_video(src, dst, steps, workers=None, queue_size=QUEUE, fps=None, fourcc=None, ext=".png",
+              progress=None, stop=None):
+    frames, src_fps, _ = open_source(src)
+    sink = open_sink(dst, fps or src_fps, fourcc, ext)
+    try:
+        return run_stream(frames, steps, sink.write, workers, queue_size, progress, stop)
+    finally:
+        sink.close()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Stream a video or image sequence through a JPEGirls pipeline.")
+    parser.add_argument("input", nargs="?", help="video file, camera index, image directory / glob or printf pattern")
+    parser.add_argument("output", nargs="?", help="video file (.mp4, .avi, ...), directory or printf pattern")
+    parser.add_argument("-p", "--op", dest="ops", action="append", default=[], metavar="NAME[:k=v,...]",
+                        help="operation step, repeat in order")
+    parser.add_argument("-j", "--workers", type=int, default=WORKERS, help="worker threads (default: all cores)")
+    parser.add_argument("--queue", type=int, default=QUEUE, help=f"frames decoded ahead (default: {QUEUE})")
+    parser.add_argument("--fps", type=float, default=None, help="output frame rate (default: the input's)")
+    parser.add_argument("--fourcc", default=None, help="video codec, e.g. mp4v, MJPG (default: by extension)")
+    parser.add_argument("--ext", default=".png", help="image extension for sequence output (default: .png)")
+    parser.add_argument("--list-ops", action="store_true", help="print available operations and exit")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.list_ops:
+        print("\n".join(ops.OPERATIONS))
+        return 0
+    if not args.input or not args.output:
+        parser.error("input and output are required")
+    try:
+        steps = [ops.parse_step(spec) for spec in args.ops]
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    if not steps:
+        print("error: no operations given (use -p NAME)", file=sys.stderr)
+        return 2
+
+    def progress(done, fps):
+        if done % 25 == 0:
+            print(f"\r{done} frames, {fps:.1f} fps", end="", file=sys.stderr, flush=True)
+
+    ext = args.ext if args.ext.startswith(".") else "." + args.ext
+    try:
+        summary = run_video(args.input, args.output, steps, args.workers, args.queue, args.fps, args.fourcc,
+                            ext, progress)
+    except (ValueError, KeyboardInterrupt) as e:
+        print(f"\nerror: {e}" if isinstance(e, ValueError) else "\ninterrupted", file=sys.stderr)
+        return 2 if isinstance(e, ValueError) else 130
+    except Exception as e:
+        # an op failing on a frame, e.g. a bad parameter (k=abc)
+        print(f"\nerror: {type(e).__name__}: {e}", file=sys.stderr)
+        return 1
+    print(f"\r{summary['frames']} frames in {summary['wall_s']:.2f} s with {summary['workers']} workers "
+          f"-> {summary['fps']:.1f} fps, {summary['mean_ms_per_frame']:.1f} ms/frame avg")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
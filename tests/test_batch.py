@@ -0,0 +1,41 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pcd_batch
+
+
+def write(path, value):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    Image.fromarray(np.full((8, 8, 3), value, dtype=np.uint8)).save(path)
+
+
+def test_same_name_in_two_folders_keeps_both(tmp_path):
+    write(str(tmp_path / "in" / "photos" / "a.png"), 10)
+    write(str(tmp_path / "in" / "scans" / "a.png"), 200)
+    out = tmp_path / "out"
+    code = pcd_batch.main([str(tmp_path / "in" / "photos"), str(tmp_path / "in" / "scans"),
+                           "-o", str(out), "-p", "negative", "-j", "1"])
+    assert code == 0
+    assert np.array(Image.open(out / "photos" / "a.png"))[0, 0, 0] == 245
+    assert np.array(Image.open(out / "scans" / "a.png"))[0, 0, 0] == 55
+
+
+def test_single_folder_stays_flat(tmp_path):
+    files = [str(tmp_path / "in" / "a.png"), str(tmp_path / "in" / "b.png")]
+    assert pcd_batch.output_paths(files, "out") == [os.path.join("out", "a.png"), os.path.join("out", "b.png")]
+
+
+def test_collision_from_ext_is_an_error(tmp_path, capsys):
+    write(str(tmp_path / "in" / "a.png"), 10)
+    write(str(tmp_path / "in" / "a.bmp"), 10)
+    with pytest.raises(ValueError, match="both be written"):
+        pcd_batch.output_paths(pcd_batch.collect_inputs([str(tmp_path / "in")]), "out", ".png")
+    code = pcd_batch.main([str(tmp_path / "in"), "-o", str(tmp_path / "out"), "-p", "negative", "--ext", "png"])
+    assert code == 2 and "both be written" in capsys.readouterr().err
+    assert not (tmp_path / "out").exists()
@@ -0,0 +1,76 @@
+import itertools
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pcd_ops as ops
+from pcd_stack import OpStack
+
+# every point op, some with several parameter values
+STEPS = [
+    ("negative", {"strength": 100}), ("negative", {"strength": 37}),
+    ("arithmetic_add", {"value": 50}), ("arithmetic_subtract", {"value": 80}),
+    ("arithmetic_multiply", {"factor": 1.7}), ("arithmetic_divide", {"factor": 2.3}),
+    ("enhance_brightness", {"factor": 1.3}), ("enhance_contrast", {"factor": 0.6}),
+    ("enhance_contrast", {"factor": 1.8}), ("thresholding", {"threshold": 127}),
+    ("color_binary", {"threshold": 90}), ("boolean_not", {"strength": 100}),
+    ("boolean_not", {"strength": 60}), ("color_cmy", {}),
+]
+
+
+def image(channels):
+    shape = (37, 53, channels) if channels else (37, 53)
+    return np.random.default_rng(channels).integers(0, 256, shape, dtype=np.uint8)
+
+
+def one_by_one(img, steps):
+    for name, params in steps:
+        img = ops.apply(name, img, **params)
+    return img
+
+
+def random_chains(count=60):
+    rng = np.random.default_rng(0)
+    for _ in range(count):
+        yield [STEPS[i] for i in rng.integers(0, len(STEPS), rng.integers(3, 8))]
+
+
+def test_every_point_op_is_covered():
+    assert {name for name, _ in STEPS} == set(ops.POINT_OPS)
+
+
+@pytest.mark.parametrize("channels", [3, 0])
+def test_pairs_fused_equal_op_by_op(channels):
+    img = image(channels)
+    for chain in itertools.product(STEPS, repeat=2):
+        chain = list(chain)
+        assert np.array_equal(ops.run_points(img, chain), one_by_one(img, chain)), chain
+
+
+@pytest.mark.parametrize("channels", [3, 0])
+def test_long_chains_fused_equal_op_by_op(channels):
+    img = image(channels)
+    for chain in random_chains():
+        assert np.array_equal(ops.run_points(img, chain), one_by_one(img, chain)), chain
+
+
+@pytest.mark.parametrize("channels", [3, 0])
+def test_pipeline_and_stack_with_point_runs(channels):
+    # point runs between neighbourhood ops, through run_pipeline and OpStack
+    img = image(channels)
+    steps = [("arithmetic_add", {"value": 30}), ("enhance_contrast", {"factor": 1.4}),
+             ("smoothing_median", {"k": 3}), ("negative", {"strength": 80}), ("color_cmy", {}),
+             ("edge_sobel", {}), ("thresholding", {"threshold": 40}), ("boolean_not", {"strength": 100})]
+    expected = one_by_one(img, steps)
+    assert np.array_equal(ops.run_pipeline(img, steps), expected)
+    stack = OpStack(img)
+    for name, params in steps:
+        stack.push(name, params)
+    assert np.array_equal(stack.result(), expected)
+    stack.update(1, {"factor": 0.7})
+    steps[1] = ("enhance_contrast", {"factor": 0.7})
+    assert np.array_equal(stack.result(), one_by_one(img, steps))
@@ -0,0 +1,43 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pcd_history import UndoHistory
+from pcd_stack import OpStack
+
+
+def test_eviction_keeps_states_and_replay_rebuilds_images():
+    src = np.random.default_rng(0).integers(0, 256, (64, 96, 3), dtype=np.uint8)
+    stack = OpStack(src)
+    history = UndoHistory(max_bytes=1)  # room for the current image only
+    history.push(stack.snapshot())
+    expected = [None]
+    for name, params in [("negative", {}), ("noise_gaussian", {"var": 200, "seed": 7}),
+                         ("smoothing_median", {"k": 3}), ("enhance_brightness", {"factor": 1.2})]:
+        stack.push(name, params)
+        expected.append(stack.result().copy())
+        history.push(stack.snapshot(), stack.result())
+    for entry in history._entries[1:]:
+        entry.image()  # wait for the compressor
+    history._evict()
+
+    assert len(history) == 5
+    assert history._entries[-1].image() is not None
+    assert all(entry.image() is None for entry in history._entries[1:-1])
+
+    for step in range(3, 0, -1):
+        entry = history.undo()
+        stack.restore(entry.state, entry.image())
+        assert len(stack) == step
+        assert np.array_equal(stack.result(), expected[step])
+
+
+def test_max_steps():
+    history = UndoHistory(max_steps=3)
+    for i in range(5):
+        history.push(i)
+    assert [e.state for e in history._entries] == [2, 3, 4]
+    assert history.undo().state == 3
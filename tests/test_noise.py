@@ -0,0 +1,28 @@
+import os
+import sys
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pcd_batch
+import pcd_noise as noise
+import pcd_ops as ops
+
+
+def test_sequence_seeds():
+    for kind in ("normal", "uniform", "rayleigh", "erlang"):
+        a = noise.unit(kind, (20, 30), [1, 2], k=3)
+        assert np.array_equal(a, noise.unit(kind, (20, 30), (1, 2), k=3))
+        assert not np.array_equal(a, noise.unit(kind, (20, 30), [1, 3], k=3))
+
+
+def test_batch_with_list_seed(tmp_path):
+    img = np.full((16, 16, 3), 128, dtype=np.uint8)
+    Image.fromarray(img).save(tmp_path / "a.png")
+    out = tmp_path / "out"
+    code = pcd_batch.main([str(tmp_path / "a.png"), "-o", str(out), "-p", "noise_gaussian:var=100,seed=[1,2]",
+                           "-j", "1"])
+    assert code == 0
+    assert np.array_equal(np.array(Image.open(out / "a.png")), ops.noise_gaussian(img, 100, seed=(1, 2)))
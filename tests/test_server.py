@@ -0,0 +1,180 @@
+import asyncio
+import http.client
+import io
+import json
+import os
+import socket
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pcd_ops as ops
+import pcd_server
+
+
+def png(img):
+    buf = io.BytesIO()
+    Image.fromarray(img).save(buf, "PNG")
+    return buf.getvalue()
+
+
+@pytest.fixture(scope="module")
+def server():
+    loop = asyncio.new_event_loop()
+    srv = pcd_server.Server(workers=1, max_body=2 * 1024 * 1024, max_pixels=1_000_000, batch_ms=50, max_batch=4)
+    ready = threading.Event()
+
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(srv.start("127.0.0.1", 0))
+        ready.set()
+        loop.run_forever()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    assert ready.wait(10)
+    yield srv
+    asyncio.run_coroutine_threadsafe(srv.close(), loop).result(10)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(10)
+
+
+def request(srv, method, path, body=None):
+    conn = http.client.HTTPConnection("127.0.0.1", srv.port, timeout=30)
+    try:
+        conn.request(method, path, body=body)
+        resp = conn.getresponse()
+        return resp.status, resp.getheader("Content-Type"), resp.read()
+    finally:
+        conn.close()
+
+
+@pytest.fixture(scope="module")
+def image():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, (48, 64, 3), dtype=np.uint8)
+
+
+def test_lists_operations(server):
+    status, ctype, body = request(server, "GET", "/ops")
+    assert status == 200 and ctype == "application/json"
+    assert json.loads(body) == list(ops.OPERATIONS)
+
+
+def test_runs_operation_like_pcd_ops(server, image):
+    status, ctype, body = request(server, "POST", "/ops/smoothing_median?k=5", png(image))
+    assert status == 200 and ctype == "image/png"
+    result = np.array(Image.open(io.BytesIO(body)))
+    assert np.array_equal(result, ops.apply("smoothing_median", image, k=5))
+
+
+def test_grayscale_result_and_jpeg(server, image):
+    status, ctype, body = request(server, "POST", "/ops/color_grayscale?format=jpeg", png(image))
+    assert status == 200 and ctype == "image/jpeg"
+    assert Image.open(io.BytesIO(body)).size == (64, 48)
+
+
+def test_errors(server, image):
+    assert request(server, "POST", "/ops/nope", png(image))[0] == 404
+    assert request(server, "GET", "/nope")[0] == 404
+    assert request(server, "GET", "/ops/negative")[0] == 405
+    assert request(server, "POST", "/ops/negative", b"not an image")[0] == 400
+    assert request(server, "POST", "/ops/smoothing_median?bogus=1", png(image))[0] == 400
+    # not a literal once parsed (inf), still the op's error, not a server one
+    assert request(server, "POST", "/ops/geometric_rotation?angle=1e999", png(image))[0] == 400
+    assert request(server, "POST", "/ops/smoothing_median?k=1e999", png(image))[0] == 400
+    # parameters are literals only, never "@file" loads
+    status, _, body = request(server, "POST", "/ops/convolution?kernel=@/etc/passwd", png(image))
+    assert status == 400
+
+
+def raw_request(srv, data):
+    with socket.create_connection(("127.0.0.1", srv.port), timeout=30) as sock:
+        sock.sendall(data)
+        reply = b""
+        while chunk := sock.recv(65536):
+            reply += chunk
+    return reply
+
+
+def test_bad_content_length(server):
+    for value in (b"-5", b"abc", b"+5", b"1_0"):
+        reply = raw_request(server, b"POST /ops/negative HTTP/1.1\r\nContent-Length: " + value + b"\r\n\r\nxxxxx")
+        assert reply.startswith(b"HTTP/1.1 400 "), reply
+
+
+def test_size_limits(server):
+    assert request(server, "POST", "/ops/negative", b"\0" * (3 * 1024 * 1024))[0] == 413
+    big = np.zeros((1200, 1000), dtype=np.uint8)  # small file, too many pixels
+    assert request(server, "POST", "/ops/negative", png(big))[0] == 413
+
+
+def test_concurrent_requests(server, image):
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(lambda _: request(server, "POST", "/ops/negative", png(image)), range(4)))
+    assert all(status == 200 for status, _, _ in results)
+    for _, _, body in results:
+        assert np.array_equal(np.array(Image.open(io.BytesIO(body))), 255 - image)
+
+
+def run_batcher(idle, submits, max_batch=8):
+    calls = []
+
+    async def results(bodies):
+        return [(200, body) for body in bodies]
+
+    def run(job, bodies):
+        calls.append((job, list(bodies)))
+        return results(bodies)
+
+    async def main():
+        batcher = pcd_server.Batcher(run, window_ms=20, max_batch=max_batch, idle=idle)
+        return await asyncio.gather(*[batcher.submit(key, key, body) for key, body in submits])
+
+    return asyncio.run(main()), calls
+
+
+def test_batcher_sends_straight_to_an_idle_worker():
+    out, calls = run_batcher(lambda: 1, [("a", b"1"), ("a", b"2")])
+    assert out == [(200, b"1"), (200, b"2")]
+    assert calls == [("a", [b"1"]), ("a", [b"2"])]
+
+
+def test_batcher_groups_when_all_workers_busy():
+    out, calls = run_batcher(lambda: 0, [("a", b"1"), ("b", b"2"), ("a", b"3"), ("a", b"4")], max_batch=2)
+    assert out == [(200, b"1"), (200, b"2"), (200, b"3"), (200, b"4")]
+    assert sorted(calls) == [("a", [b"1", b"3"]), ("a", [b"4"]), ("b", [b"2"])]
+
+
+def test_batch_is_spread_over_the_pool(image):
+    srv = pcd_server.Server(workers=3)
+    srv.pool = ThreadPoolExecutor(3)
+
+    async def main():
+        pending = srv._run_batch(("negative", {}, "png"), [png(image)] * 7)
+        idle = srv.idle_workers()
+        return idle, await pending
+
+    try:
+        idle_during, results = asyncio.run(main())
+    finally:
+        srv.pool.shutdown()
+    assert srv.metrics.batches == 3 and idle_during == 0 and srv.idle_workers() == 3
+    assert [status for status, _ in results] == [200] * 7
+    assert np.array_equal(np.array(Image.open(io.BytesIO(results[-1][1]))), 255 - image)
+
+
+def test_metrics(server, image):
+    request(server, "POST", "/ops/negative", png(image))
+    status, _, body = request(server, "GET", "/metrics")
+    metrics = json.loads(body)
+    assert status == 200
+    entry = metrics["ops"]["negative"]
+    assert entry["requests"] >= 1 and entry["latency_ms"]["p95"] >= entry["latency_ms"]["p50"] > 0
+    assert metrics["batches"] >= 1 and metrics["mean_batch_size"] >= 1
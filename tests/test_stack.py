@@ -0,0 +1,62 @@
+import os
+import sys
+import types
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pcd_ops as ops
+from pcd_stack import OpStack
+
+
+def zoomed_stack():
+    # zoom x2, then a seed that only exists in the zoomed image
+    src = np.random.default_rng(0).integers(0, 256, (100, 200, 3), dtype=np.uint8)
+    stack = OpStack(src)
+    stack.push("geometric_zooming", {"factor": 2.0})
+    stack.push("segmentation_region_growing", {"x": 300, "y": 150, "tol": 20})
+    return stack, stack.result().copy()
+
+
+def test_remove_upstream_node_that_breaks_a_later_one():
+    stack, before = zoomed_stack()
+    with pytest.raises(ValueError, match="outside"):
+        stack.checked(lambda s: s.remove(0))
+    assert [n.name for n in stack.nodes] == ["geometric_zooming", "segmentation_region_growing"]
+    assert np.array_equal(stack.result(), before)
+    stack.push("negative", {})  # still usable
+    assert np.array_equal(stack.result(), 255 - before)
+
+
+def test_edit_upstream_node_that_breaks_a_later_one():
+    stack, before = zoomed_stack()
+    with pytest.raises(ValueError):
+        stack.checked(lambda s: s.update(0, {"factor": 1.0}))
+    assert stack.nodes[0].params == {"factor": 2.0}
+    assert np.array_equal(stack.result(), before)
+
+
+def test_checked_change_is_adopted():
+    stack, _ = zoomed_stack()
+    stack.checked(lambda s: s.update(0, {"factor": 1.8}))
+    assert stack.nodes[0].params == {"factor": 1.8}
+    src = stack.source
+    expected = ops.segmentation_region_growing(ops.geometric_zooming(src, 1.8), 300, 150, tol=20)
+    assert np.array_equal(stack.result(), expected)
+
+
+def test_ui_remove_rolls_back_without_history_entry(monkeypatch):
+    import UasPCD
+
+    stack, before = zoomed_stack()
+    errors, recorded = [], []
+    monkeypatch.setattr(UasPCD.messagebox, "showerror", lambda title, msg: errors.append(msg))
+    app = types.SimpleNamespace(stack=stack, _selected_step=lambda: 0,
+                                _refresh_processed=lambda: None, _record_history=lambda: recorded.append(1))
+    app._change_stack = types.MethodType(UasPCD.JPEGirlsDeluxePro_UI._change_stack, app)
+    UasPCD.JPEGirlsDeluxePro_UI.remove_history_step(app)
+    assert len(errors) == 1 and "outside" in errors[0]
+    assert not recorded and len(stack) == 2
+    assert np.array_equal(stack.result(), before)
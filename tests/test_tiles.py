@@ -0,0 +1,70 @@
+import os
+import sys
+
+import cv2
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pcd_ops as ops
+import pcd_tiles as tiles
+
+
+def test_map_keeps_order_and_bounds_tiles_in_flight():
+    pulled = []
+
+    def items():
+        for i in range(50):
+            pulled.append(i)
+            yield i
+
+    results = tiles._map(lambda i: i * i, items(), workers=3)
+    assert next(results) == 0
+    # the first result is handed out once the window (2 * workers) is full
+    assert len(pulled) <= 2 * 3 + 1
+    assert list(results) == [i * i for i in range(1, 50)]
+
+
+# every tiled op with a non-trivial parameter where it has one
+CASES = [
+    ("negative", {"strength": 70}), ("arithmetic_add", {"value": 40}), ("arithmetic_subtract", {"value": 40}),
+    ("arithmetic_multiply", {"factor": 1.5}), ("arithmetic_divide", {"factor": 1.5}),
+    ("thresholding", {"threshold": 100}), ("color_grayscale", {}), ("color_binary", {"threshold": 100}),
+    ("smoothing_lowpass", {"k": 7}), ("smoothing_median", {"k": 5}),
+    ("convolution", {"kernel": [[1, 0, -1, 2, 0], [0, 3, 1, -2, 1], [2, -1, 0, 1, -3]]}),
+    ("convolution", {}), ("sharpening_highpass", {}), ("sharpening_highboost", {"A": 1.8}),
+    ("edge_sobel", {}), ("edge_prewitt", {}), ("edge_robert", {}), ("edge_laplacian", {}), ("edge_log", {}),
+    ("edge_compass", {}), ("edge_kirsch", {}), ("edge_robinson", {}),
+]
+
+
+def image(channels):
+    shape = (101, 143, channels) if channels else (101, 143)
+    img = np.random.default_rng(channels).integers(0, 256, shape, dtype=np.uint8)
+    return cv2.GaussianBlur(img, (0, 0), 1.5)  # some structure for the edge ops
+
+
+def test_every_tiled_op_is_covered():
+    assert {name for name, _ in CASES} == set(tiles.TILED_OPS)
+
+
+@pytest.mark.parametrize("channels", [3, 0])
+@pytest.mark.parametrize("name, params", CASES, ids=[f"{n}-{i}" for i, (n, _) in enumerate(CASES)])
+def test_tiled_equals_untiled(tmp_path, channels, name, params):
+    img = image(channels)
+    expected = ops.apply(name, img, **params)
+    # odd tile size: tiles and halos don't line up with anything
+    assert np.array_equal(tiles.run_tiled(img, name, params, tile=37), expected)
+    mapped = tiles.run_tiled(img, name, params, out_path=str(tmp_path / "out.npy"), tile=37, workers=2)
+    assert np.array_equal(np.asarray(mapped), expected)
+    assert np.array_equal(tiles.run_parallel(img, name, params, workers=3), expected)
+
+
+@pytest.mark.parametrize("channels", [3, 0])
+def test_tiled_pipeline_equals_untiled(tmp_path, channels):
+    img = image(channels)
+    steps = [("smoothing_median", {"k": 3}), ("arithmetic_add", {"value": 20}), ("edge_sobel", {}),
+             ("thresholding", {"threshold": 60})]
+    out = tiles.run_tiled_pipeline(img, steps, str(tmp_path / "out.npy"), tile=29, workdir=str(tmp_path), workers=2)
+    assert np.array_equal(np.asarray(out), ops.run_pipeline(img, steps))
@@ -0,0 +1,32 @@
+import os
+import sys
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pcd_video
+
+
+def frames(tmp_path, n=3):
+    src = tmp_path / "frames"
+    src.mkdir()
+    for i in range(n):
+        Image.fromarray(np.full((12, 16, 3), 40 * i, dtype=np.uint8)).save(src / f"{i:03d}.png")
+    return src
+
+
+def test_sequence_to_sequence(tmp_path):
+    out = tmp_path / "out"
+    assert pcd_video.main([str(frames(tmp_path)), str(out), "-p", "negative", "-j", "2"]) == 0
+    written = sorted(os.listdir(out))
+    assert len(written) == 3
+    assert np.array(Image.open(out / written[2]))[0, 0, 0] == 255 - 80
+
+
+def test_bad_op_parameter_is_reported(tmp_path, capsys):
+    code = pcd_video.main([str(frames(tmp_path)), str(tmp_path / "out"), "-p", "smoothing_median:k=abc"])
+    err = capsys.readouterr().err
+    assert code == 1
+    assert "error: TypeError" in err and "Traceback" not in err
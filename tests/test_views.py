@@ -0,0 +1,73 @@
+import os
+import sys
+import threading
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pcd_ops as ops
+
+
+def run_with_timeout(fn, seconds=10):
+    # a deadlock would hang the whole suite, so run in a daemon thread
+    errors = []
+
+    def target():
+        try:
+            fn()
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(seconds)
+    assert not thread.is_alive(), "deadlocked"
+    if errors:
+        raise errors[0]
+
+
+def read_only(shape, seed):
+    img = np.random.default_rng(seed).integers(0, 256, shape, dtype=np.uint8)
+    img.setflags(write=False)
+    return img
+
+
+def test_eviction_of_view_that_is_a_key(monkeypatch):
+    # the gray view of a cached source is a cache key too (for its float
+    # view); evicting the source drops the gray's last reference and runs
+    # its weakref callback. One source with both views fits the budget.
+    monkeypatch.setattr(ops, "VIEW_CACHE_BYTES", 20000)
+    ops.clear_views()
+    sources = [read_only((40, 60, 3), seed) for seed in range(3)]
+
+    def chain():
+        for src in sources:
+            ops.edge_prewitt(ops.color_grayscale(src))
+
+    run_with_timeout(chain)
+    assert len(ops._views) == 2
+    run_with_timeout(ops.clear_views)
+    assert not ops._views
+
+
+def test_clear_views_with_nested_keys():
+    ops.clear_views()
+    src = read_only((40, 60, 3), 0)
+
+    def chain():
+        ops.edge_prewitt(ops.color_grayscale(src))
+        assert len(ops._views) == 2
+        ops.clear_views()
+
+    run_with_timeout(chain)
+
+
+def test_views_are_shared_and_dropped():
+    ops.clear_views()
+    src = read_only((60, 80, 3), 0)
+    gray = ops.color_grayscale(src)
+    assert ops.color_grayscale(src) is gray
+    assert not gray.flags.writeable
+    del src, gray
+    assert not ops._views